@@ -2,16 +2,45 @@ import json
 import os
 
 SENTIMENT_DICT_FILE = "sentiment_dict.json"
+# Left behind by older versions that appended changed weights; folded in on load
+SENTIMENT_DELTA_FILE = "sentiment_dict.delta.jsonl"
 
 def load_sentiment_dict():
+    sent_dict = {}
     if os.path.exists(SENTIMENT_DICT_FILE):
         with open(SENTIMENT_DICT_FILE, "r") as f:
-            return json.load(f)
-    return {}
+            sent_dict = json.load(f)
 
-def save_sentiment_dict(sent_dict):
-    with open(SENTIMENT_DICT_FILE, "w") as f:
+    if os.path.exists(SENTIMENT_DELTA_FILE):
+        with open(SENTIMENT_DELTA_FILE, "r") as f:
+            for line in f:
+                try:
+                    word, weight = json.loads(line)
+                except ValueError:
+                    continue  # torn last line from an interrupted append
+                sent_dict[word] = weight
+
+    return sent_dict
+
+def save_sentiment_dict(sent_dict, changed=None):
+    """Write the whole dictionary as a new snapshot.
+
+    The dictionary is small, so every save is a full snapshot written to a
+    temp file and swapped in; a crash never leaves a half-written file. With
+    `changed` (the words updated since the last save) an empty set skips
+    the write.
+    """
+    if changed is not None and not changed and os.path.exists(SENTIMENT_DICT_FILE):
+        return
+
+    tmp_file = SENTIMENT_DICT_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
         json.dump(sent_dict, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, SENTIMENT_DICT_FILE)
+    if os.path.exists(SENTIMENT_DELTA_FILE):
+        os.remove(SENTIMENT_DELTA_FILE)
 
 def analyze_sentiment(tokens, sent_dict):
     score = 0
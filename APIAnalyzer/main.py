@@ -1,5 +1,5 @@
 from fetch_news import fetch_news_from_api
-from preprocess import preprocess
+from preprocess import BatchPreprocessor
 from analyzer import load_sentiment_dict, analyze_sentiment, save_sentiment_dict
 from updater import update_dictionary
 
@@ -8,9 +8,14 @@ def main():
     news_list = fetch_news_from_api()
 
     sent_dict = load_sentiment_dict()
+    changed = set()
 
-    for news in news_list:
-        tokens = preprocess(news)
+    # Preprocess the whole day of headlines in one call
+    preprocessor = BatchPreprocessor()
+    tokens_list = preprocessor.process(news_list)
+    print(f"Preprocessed {len(news_list)} headlines: {preprocessor.report()}")
+
+    for news, tokens in zip(news_list, tokens_list):
         score, unknown_words = analyze_sentiment(tokens, sent_dict)
         print(f"\nNews: {news}")
         print(f"Tokens: {tokens}")
@@ -18,9 +23,9 @@ def main():
         print(f"Unknown Words: {unknown_words}")
 
         # Update dictionary based on score
-        sent_dict = update_dictionary(sent_dict, unknown_words, score)
+        sent_dict = update_dictionary(sent_dict, unknown_words, score, changed)
 
-    save_sentiment_dict(sent_dict)
+    save_sentiment_dict(sent_dict, changed)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
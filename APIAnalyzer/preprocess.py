@@ -2,6 +2,17 @@ import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+_stop_words = None
+
+def get_stop_words():
+    # Build the stopword set once per process instead of on every call
+    global _stop_words
+    if _stop_words is None:
+        _stop_words = frozenset(stopwords.words('english'))
+    return _stop_words
 
 def preprocess(text):
     # Lowercase
@@ -11,10 +22,83 @@ def preprocess(text):
     tokens = word_tokenize(text)
 
     # Remove punctuation and stopwords
-    stop_words = set(stopwords.words('english'))
+    stop_words = get_stop_words()
     cleaned_tokens = [
         word for word in tokens
         if word.isalpha() and word not in stop_words
     ]
 
-    return cleaned_tokens
\ No newline at end of file
+    return cleaned_tokens
+
+class BatchPreprocessor:
+    """Preprocess many headlines in one call, same output as preprocess() per headline.
+
+    The stopword set is loaded once. Batches of at least `parallel_threshold`
+    headlines are split into `chunk_size` chunks and spread across `workers`
+    processes (0 = stay in this process). After each call `timings` holds the
+    seconds spent per stage (lowercase, tokenize, filter; summed over workers
+    when parallel) plus the wall-clock total.
+    """
+
+    def __init__(self, workers=0, chunk_size=1000, parallel_threshold=5000, stop_words=None):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.parallel_threshold = parallel_threshold
+        self.stop_words = frozenset(stop_words) if stop_words is not None else get_stop_words()
+        self.timings = {}
+
+    def _process_chunk(self, texts):
+        timings = {}
+
+        start = time.perf_counter()
+        lowered = [text.lower() for text in texts]
+        timings['lowercase'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tokenized = [word_tokenize(text) for text in lowered]
+        timings['tokenize'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stop_words = self.stop_words
+        cleaned = [
+            [word for word in tokens if word.isalpha() and word not in stop_words]
+            for tokens in tokenized
+        ]
+        timings['filter'] = time.perf_counter() - start
+
+        return cleaned, timings
+
+    def process(self, texts):
+        """Token lists for a list or iterator of headlines, in input order."""
+        texts = list(texts)
+        start = time.perf_counter()
+
+        if self.workers and len(texts) >= self.parallel_threshold:
+            chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+            results = []
+            timings = {'lowercase': 0.0, 'tokenize': 0.0, 'filter': 0.0}
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.stop_words,)) as pool:
+                for cleaned, chunk_timings in pool.map(_process_worker_chunk, chunks):
+                    results.extend(cleaned)
+                    for stage, seconds in chunk_timings.items():
+                        timings[stage] += seconds
+        else:
+            results, timings = self._process_chunk(texts)
+
+        timings['total'] = time.perf_counter() - start
+        self.timings = timings
+        return results
+
+    def report(self):
+        return ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in self.timings.items())
+
+# Per-process preprocessor for the pool, created once by the initializer
+_worker = None
+
+def _init_worker(stop_words):
+    global _worker
+    _worker = BatchPreprocessor(stop_words=stop_words)
+
+def _process_worker_chunk(texts):
+    return _worker._process_chunk(texts)
\ No newline at end of file
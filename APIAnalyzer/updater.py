@@ -1,4 +1,4 @@
-def update_dictionary(sent_dict, unknown_words, score):
+def update_dictionary(sent_dict, unknown_words, score, changed=None):
     # Simple update logic: assume unknown words carry the same sentiment as the headline
     if not unknown_words:
         return sent_dict
@@ -12,4 +12,8 @@ def update_dictionary(sent_dict, unknown_words, score):
         else:
             sent_dict[word] = weight
 
+    # Record touched words so save_sentiment_dict can skip a run that learned nothing
+    if changed is not None:
+        changed.update(unknown_words)
+
     return sent_dict
\ No newline at end of file
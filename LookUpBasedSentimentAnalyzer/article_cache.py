@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_PATH = os.path.join(script_dir, "article_cache.sqlite")
+
+# Query parameters that change per referral but not the article itself
+TRACKING_PARAMS = {"guccounter", "guce_referrer", "guce_referrer_sig", "ncid", "soc_src", "soc_trk", ".tsrc", "fr", "yptr"}
+
+
+def normalize_url(url):
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in TRACKING_PARAMS and not k.startswith("utm_")
+    )
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+class ArticleCache:
+    """On-disk cache of extracted article text, keyed by normalized URL.
+
+    Entries are zlib-compressed JSON in a single SQLite file, so several
+    scripts and processes can share it. Entries older than `ttl` seconds are
+    treated as missing, and once the stored size exceeds `max_bytes` the least
+    recently read entries are evicted. `kind` separates texts produced by
+    different extractors for the same URL.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=7 * 24 * 3600, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " key TEXT PRIMARY KEY, url TEXT, fetched_at REAL, accessed_at REAL, size INTEGER, body BLOB)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS articles_accessed ON articles (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def key(url, kind="text"):
+        return hashlib.sha256(f"{kind}\0{normalize_url(url)}".encode("utf-8")).hexdigest()
+
+    def get(self, url, kind="text"):
+        key = self.key(url, kind)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT fetched_at, body FROM articles WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl and now - row[0] > self.ttl):
+                if row is not None:
+                    self._conn.execute("DELETE FROM articles WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE articles SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(zlib.decompress(row[1]))
+
+    def put(self, url, article, kind="text"):
+        """Store `article` (any JSON-serializable value, e.g. {"title": ..., "text": ...})."""
+        body = zlib.compress(json.dumps(article).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles (key, url, fetched_at, accessed_at, size, body) VALUES (?, ?, ?, ?, ?, ?)",
+                (self.key(url, kind), normalize_url(url), now, now, len(body), body),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Trim to 90% so we do not evict on every subsequent put
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM articles ORDER BY accessed_at"):
+            victims.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self._conn.executemany("DELETE FROM articles WHERE key = ?", victims)
+
+    def get_or_fetch(self, url, fetch, kind="text"):
+        cached = self.get(url, kind)
+        if cached is not None:
+            return cached
+        article = fetch(url)
+        if article:
+            self.put(url, article, kind)
+        return article
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """Process-wide ArticleCache at DEFAULT_CACHE_PATH."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ArticleCache()
+        return _default_cache
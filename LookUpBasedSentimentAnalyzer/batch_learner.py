@@ -0,0 +1,84 @@
+import re
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+WORD_RE = re.compile(r'\b\w+\b')
+
+
+class BatchLearner:
+    """Vectorized version of SentimentAnalyzer.update_dictionary for a batch of articles.
+
+    Builds a binary document-term matrix X (one row per article, one column
+    per distinct word of three or more characters) and applies
+
+        weights[vocab] += learning_rate * X.T @ scores
+
+    in one sparse product, with articles scoring inside the neutral band
+    contributing nothing, exactly like the per-article rule.
+
+    Differences from calling update_dictionary once per article:
+
+    - Given the same scores, the resulting weights are identical up to
+      floating-point summation order (the per-word deltas are summed before
+      being added, not added one article at a time).
+    - When scoring and learning happen in the same pass, all articles of a
+      batch are scored with the dictionary as it was at the start of the
+      batch; the sequential path lets article k see what articles 0..k-1 just
+      taught it. Batches are a single poll or a single backfill day.
+    """
+
+    def __init__(self, learning_rate=0.05, min_word_length=3, neutral_band=0.01):
+        self.learning_rate = learning_rate
+        self.min_word_length = min_word_length
+        self.neutral_band = neutral_band
+
+    def doc_term_matrix(self, texts):
+        """Binary CSR matrix (documents x vocabulary) and the vocabulary array."""
+        tokens = [WORD_RE.findall(text.lower()) for text in texts]
+        lengths = np.fromiter((len(t) for t in tokens), dtype=np.int64, count=len(tokens))
+        flat = [word for doc in tokens for word in doc]
+        codes, vocab = pd.factorize(pd.Series(flat, dtype=object), sort=False)
+        vocab = np.asarray(vocab, dtype=object)
+        rows = np.repeat(np.arange(len(tokens)), lengths)
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(codes), dtype=np.float64), (rows, codes)),
+            shape=(len(tokens), len(vocab)),
+        )
+        matrix.sum_duplicates()
+        matrix.data[:] = 1.0  # a word counts once per article, as with set() in update_dictionary
+
+        keep = np.fromiter((len(w) >= self.min_word_length for w in vocab), dtype=bool, count=len(vocab))
+        if not keep.all():
+            matrix = matrix[:, np.flatnonzero(keep)]
+            vocab = vocab[keep]
+        return matrix, vocab
+
+    def deltas(self, texts, scores):
+        """(vocab, weight change per vocab term) for a batch of article texts and their scores."""
+        scores = np.asarray(scores, dtype=np.float64)
+        effective = np.where(np.abs(scores) < self.neutral_band, 0.0, scores)
+        if not effective.any():
+            return np.empty(0, dtype=object), np.empty(0, dtype=np.float64)
+
+        # Neutral articles contribute nothing, so leave them out of the matrix entirely
+        active = np.flatnonzero(effective)
+        matrix, vocab = self.doc_term_matrix([texts[i] for i in active])
+        return vocab, self.learning_rate * (matrix.T @ effective[active])
+
+    def apply(self, sentiment_dict, texts, scores):
+        """Update `sentiment_dict` in place; returns the terms whose weight changed."""
+        vocab, delta = self.deltas(texts, scores)
+        if not len(vocab):
+            return []
+
+        # Gather current weights into a vocab-indexed array, update in one shot, scatter back
+        current = getattr(sentiment_dict, 'peek', sentiment_dict.get)
+        weights = np.fromiter((current(term, 0) for term in vocab), dtype=np.float64, count=len(vocab))
+        weights += delta
+        terms = vocab.tolist()
+        for term, weight in zip(terms, weights.tolist()):
+            sentiment_dict[term] = weight
+        return terms
@@ -0,0 +1,56 @@
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from batch_learner import BatchLearner
+from main import SEED_DICTIONARY, SentimentAnalyzer
+
+
+def make_corpus(n, vocab_size, max_words=400, seed=0):
+    """Synthetic articles over a Zipf-ish vocabulary, plus scores with some neutral ones mixed in."""
+    rng = random.Random(seed)
+    vocab = list(SEED_DICTIONARY) + [f"term{i}" for i in range(vocab_size)] + ["a", "an", "on", "of", "to"]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    texts = [" ".join(rng.choices(vocab, weights, k=rng.randint(min(20, max_words), max_words))).capitalize() for _ in range(n)]
+    scores = [0.0 if rng.random() < 0.1 else rng.uniform(-1.5, 1.5) for _ in range(n)]
+    return texts, scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batch dictionary learning against update_dictionary')
+    parser.add_argument('--n', type=int, default=20000, help='Number of synthetic articles')
+    parser.add_argument('--vocab', type=int, default=50000, help='Synthetic vocabulary size')
+    parser.add_argument('--max-words', type=int, default=400, help='Longest synthetic article in words')
+    parser.add_argument('--batch-size', type=int, default=0, help='Articles per batch (0 = whole corpus)')
+    args = parser.parse_args()
+
+    texts, scores = make_corpus(args.n, args.vocab, args.max_words)
+    batch_size = args.batch_size or len(texts)
+    print(f"{len(texts)} articles, {sum(len(t.split()) for t in texts)} tokens, batches of {batch_size}")
+
+    sequential = SimpleNamespace(sentiment_dict=dict(SEED_DICTIONARY), learning_rate=0.05, changed_terms=set())
+    start = time.perf_counter()
+    for text, score in zip(texts, scores):
+        SentimentAnalyzer.update_dictionary(sequential, text, score)
+    baseline = time.perf_counter() - start
+
+    batched = dict(SEED_DICTIONARY)
+    learner = BatchLearner(learning_rate=0.05)
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        learner.apply(batched, texts[i:i + batch_size], scores[i:i + batch_size])
+    elapsed = time.perf_counter() - start
+
+    assert batched.keys() == sequential.sentiment_dict.keys(), "vocabularies differ"
+    diff = max(abs(batched[t] - sequential.sentiment_dict[t]) for t in batched)
+    print(f"update_dictionary loop: {baseline:.3f}s ({len(texts) / baseline:,.0f} articles/s)")
+    print(f"BatchLearner          : {elapsed:.3f}s ({len(texts) / elapsed:,.0f} articles/s), {baseline / elapsed:.1f}x")
+    print(f"{len(batched)} terms, max |weight difference| {diff:.2e} (float summation order)")
+    np.testing.assert_allclose([batched[t] for t in batched], [sequential.sentiment_dict[t] for t in batched], atol=1e-9)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import os
+import time
+
+import pandas as pd
+import scipy
+import torch
+
+from finbert_scorer import FinBertScorer
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CORPUS = os.path.join(script_dir, "..", "finviz_sentiment_data.csv")
+
+
+def load_corpus(path, n):
+    titles = pd.read_csv(path)["title"].dropna().astype(str).tolist()
+    # Repeat the local corpus with varying lengths so buckets are not trivially uniform
+    docs = []
+    i = 0
+    while len(docs) < n:
+        docs.append(" ".join(titles[(i + k) % len(titles)] for k in range(1 + i % 6)))
+        i += 1
+    return docs
+
+
+def per_document(scorer, texts):
+    # The original sentiment_finbert.finbert_sentiment loop: one forward pass and one softmax per text
+    with torch.no_grad():
+        for text in texts:
+            inputs = scorer.tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
+            logits = scorer.model(**inputs).logits
+            scipy.special.softmax(logits.numpy().squeeze())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FinBERT throughput (docs/s) across batch sizes")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="CSV with a title column")
+    parser.add_argument("--n", type=int, default=512, help="Number of documents")
+    parser.add_argument("--batch-sizes", default="1,4,8,16,32,64", help="Comma-separated batch sizes")
+    parser.add_argument("--threads", type=int, default=None, help="torch.set_num_threads value")
+    parser.add_argument("--chunked", action="store_true", help="Also time sliding-window scoring of long documents")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    texts = load_corpus(args.corpus, args.n)
+    scorer = FinBertScorer()
+
+    start = time.perf_counter()
+    per_document(scorer, texts)
+    elapsed = time.perf_counter() - start
+    print(f"{'per-document':>14}: {len(texts) / elapsed:8.1f} docs/s ({elapsed:.2f}s)")
+
+    for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+        scorer.batch_size = batch_size
+        start = time.perf_counter()
+        scorer.predict_proba(texts)
+        elapsed = time.perf_counter() - start
+        print(f"{f'batch={batch_size}':>14}: {len(texts) / elapsed:8.1f} docs/s ({elapsed:.2f}s)")
+
+    if args.chunked:
+        # Long articles: glue groups of 40 headlines together so most documents span several windows
+        long_texts = [" ".join(texts[i:i + 40]) for i in range(0, len(texts), 40)]
+        scorer.chunked = True
+        for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+            scorer.batch_size = batch_size
+            start = time.perf_counter()
+            scorer.predict_proba(long_texts)
+            elapsed = time.perf_counter() - start
+            print(f"{f'chunked={batch_size}':>14}: {len(long_texts) / elapsed:8.1f} docs/s ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
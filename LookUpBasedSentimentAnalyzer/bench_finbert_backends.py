@@ -0,0 +1,91 @@
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from bench_finbert import DEFAULT_CORPUS, load_corpus
+from finbert_scorer import BACKENDS, FinBertScorer
+
+
+def timed_predict(scorer, texts, repeats):
+    scorer.predict_proba(texts[: scorer.batch_size])  # warm-up
+    timings = []
+    probs = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        probs = scorer.predict_proba(texts)
+        timings.append(time.perf_counter() - start)
+    return probs, min(timings)
+
+
+def single_doc_latency(scorer, texts, n=50):
+    batch_size = scorer.batch_size
+    scorer.batch_size = 1
+    latencies = []
+    for text in texts[:n]:
+        start = time.perf_counter()
+        scorer.predict_proba([text])
+        latencies.append(time.perf_counter() - start)
+    scorer.batch_size = batch_size
+    return np.percentile(latencies, 50) * 1000, np.percentile(latencies, 95) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency, throughput and label drift of FinBERT CPU backends vs fp32")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="CSV with a title column")
+    parser.add_argument("--n", type=int, default=512, help="Number of documents")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--backends", default=",".join(BACKENDS), help="Comma-separated backends to compare")
+    parser.add_argument("--threads", type=int, default=None, help="torch.set_num_threads value")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    texts = load_corpus(args.corpus, args.n)
+    backends = args.backends.split(",")
+    if "torch" not in backends:
+        backends.insert(0, "torch")
+
+    results = {}
+    for backend in backends:
+        try:
+            scorer = FinBertScorer(batch_size=args.batch_size, backend=backend)
+        except ImportError as e:
+            print(f"Skipping {backend}: {e}")
+            continue
+        probs, elapsed = timed_predict(scorer, texts, args.repeats)
+        p50, p95 = single_doc_latency(scorer, texts)
+        results[backend] = (scorer.labels, probs, elapsed, p50, p95)
+
+    labels, reference, reference_time, _, _ = results["torch"]
+    reference_labels = reference.argmax(axis=1)
+
+    print(f"\n{len(texts)} documents, batch size {args.batch_size}\n")
+    print(f"{'backend':>8} {'docs/s':>9} {'speedup':>8} {'p50 ms':>8} {'p95 ms':>8} {'agree':>7} {'mean|dp|':>9} {'max|dp|':>8}")
+    for backend, (_, probs, elapsed, p50, p95) in results.items():
+        agreement = np.mean(probs.argmax(axis=1) == reference_labels)
+        diff = np.abs(probs - reference)
+        print(
+            f"{backend:>8} {len(texts) / elapsed:9.1f} {reference_time / elapsed:7.2f}x {p50:8.1f} {p95:8.1f} "
+            f"{agreement:7.2%} {diff.mean():9.4f} {diff.max():8.4f}"
+        )
+
+    # Label drift: where do the flipped documents go?
+    for backend, (_, probs, _, _, _) in results.items():
+        if backend == "torch":
+            continue
+        predicted = probs.argmax(axis=1)
+        flipped = predicted != reference_labels
+        print(f"\nLabel drift {backend} vs fp32: {int(flipped.sum())} of {len(texts)} documents changed label")
+        for i, source in enumerate(labels):
+            for j, target in enumerate(labels):
+                count = int(np.sum((reference_labels == i) & (predicted == j)))
+                if i != j and count:
+                    print(f"  {source} -> {target}: {count}")
+
+
+if __name__ == "__main__":
+    main()
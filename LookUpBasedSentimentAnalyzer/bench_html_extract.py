@@ -0,0 +1,43 @@
+import argparse
+import os
+import time
+
+from html_extract import BACKENDS, available_backends, describe_backend, extract_article_text, extract_yahoo_news_items
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = {
+    "article text": (os.path.join(script_dir, "fixtures", "yahoo_article.html"), extract_article_text),
+    "yahoo news list": (os.path.join(script_dir, "fixtures", "yahoo_quote_news.html"), extract_yahoo_news_items),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML extraction backends on saved fixtures")
+    parser.add_argument("--repeats", type=int, default=50, help="Parses per fixture and backend")
+    args = parser.parse_args()
+
+    backends = available_backends()
+    print(f"Available backends: {', '.join(backends)}; default: {describe_backend()}")
+    for backend in BACKENDS:
+        if backend not in backends:
+            print(f"  {backend} is NOT installed/importable and is not measured")
+
+    for name, (path, extract) in FIXTURES.items():
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+
+        reference = extract(html, backend="bs4")
+        baseline = None
+        print(f"\n{name} ({os.path.basename(path)}, {len(html) / 1024:.0f} KiB)")
+        for backend in reversed(backends):
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                result = extract(html, backend=backend)
+            elapsed = (time.perf_counter() - start) / args.repeats
+            baseline = baseline or elapsed
+            same = "same output" if result == reference else "DIFFERS from bs4"
+            print(f"  {backend:>10}: {elapsed * 1000:7.2f} ms/page  {baseline / elapsed:5.1f}x  {same}  [{describe_backend(backend)}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import contextlib
+import io
+import random
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from dictionary_store import DictionaryStore
+from lexicon_scorer import LexiconScorer
+from main import SentimentAnalyzer
+
+# Vocabulary for synthetic headlines: seed terms, negations/fillers and neutral filler words
+SEED_TERMS = ["gain", "growth", "profit", "surge", "beat", "upgrade", "loss", "decline", "drop", "miss",
+              "lawsuit", "downgrade", "risk", "warning", "recall"]
+NEGATION_TERMS = ["not", "no", "never", "without", "doesn't", "isn't", "a", "the", "very"]
+FILLER_TERMS = ["boeing", "shares", "quarter", "analysts", "said", "company", "market", "(reuters)",
+                "stock", "on", "after", "jet", "orders", "deliveries", "ceo", "q2,", "2025"]
+
+
+def make_headlines(n, seed=0):
+    rng = random.Random(seed)
+    vocab = SEED_TERMS + NEGATION_TERMS + FILLER_TERMS * 3
+    return [" ".join(rng.choice(vocab) for _ in range(rng.randint(6, 40))).capitalize() for _ in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark LexiconScorer against score_with_dictionary')
+    parser.add_argument('--n', type=int, default=50000, help='Number of synthetic headlines')
+    args = parser.parse_args()
+
+    texts = make_headlines(args.n)
+    # Seed dictionary, built without touching logs/ on disk
+    sentiment_dict = SentimentAnalyzer._load_dictionary(SimpleNamespace(dictionary_store=DictionaryStore('__missing__.json')))
+    analyzer = SimpleNamespace(sentiment_dict=sentiment_dict)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = np.array([SentimentAnalyzer.score_with_dictionary(analyzer, t) for t in texts], dtype=np.float64)
+    baseline = time.perf_counter() - start
+
+    scorer = LexiconScorer(sentiment_dict)
+    start = time.perf_counter()
+    scores = scorer.score_batch(texts)
+    compiled = time.perf_counter() - start
+
+    mismatches = int(np.count_nonzero(scores != expected))
+    print(f"{len(texts)} headlines")
+    print(f"score_with_dictionary: {baseline:.3f}s ({len(texts) / baseline:,.0f} texts/s)")
+    print(f"LexiconScorer.score_batch: {compiled:.3f}s ({len(texts) / compiled:,.0f} texts/s)")
+    print(f"Speedup: {baseline / compiled:.1f}x, mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
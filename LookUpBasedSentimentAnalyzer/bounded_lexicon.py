@@ -0,0 +1,112 @@
+import heapq
+from collections.abc import MutableMapping
+
+POLICIES = ("weight", "lru", "lfu")
+
+
+class BoundedLexicon(MutableMapping):
+    """{term: weight} mapping that never holds more than `capacity` terms.
+
+    When an insert pushes it over capacity, unpinned terms are evicted down to
+    `low_water` * capacity in one batch (so eviction cost is amortized over
+    many inserts) according to `policy`:
+
+    - "weight": smallest |weight| first, i.e. near-neutral boilerplate
+    - "lru": least recently matched first
+    - "lfu": fewest matches first, least recently matched among ties
+
+    A match is a lookup through get(), which is what the scorers use;
+    `[]`, `in` and iteration do not count, so saving or printing the
+    dictionary does not disturb the policy. Pinned terms (the seed lexicon)
+    are never evicted. `on_evict(term)` is called for every evicted term,
+    e.g. to log its removal.
+    """
+
+    def __init__(self, terms=None, capacity=50_000, policy="weight", pinned=(), low_water=0.9, on_evict=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown eviction policy {policy!r}, choose from {POLICIES}")
+        self.capacity = capacity
+        self.policy = policy
+        self.pinned = frozenset(pinned)
+        self.low_water = low_water
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.eviction_runs = 0
+        self._weights = {}
+        self._last_used = {}
+        self._uses = {}
+        self._clock = 0
+        if terms:
+            for term, weight in terms.items():
+                self[term] = weight
+
+    def __getitem__(self, term):
+        return self._weights[term]
+
+    def __contains__(self, term):
+        return term in self._weights
+
+    def __iter__(self):
+        return iter(self._weights)
+
+    def __len__(self):
+        return len(self._weights)
+
+    def get(self, term, default=None):
+        weight = self._weights.get(term)
+        if weight is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._clock += 1
+        self._last_used[term] = self._clock
+        self._uses[term] += 1
+        return weight
+
+    def peek(self, term, default=None):
+        """Like get() but without counting as a match."""
+        return self._weights.get(term, default)
+
+    def __setitem__(self, term, weight):
+        if term not in self._weights:
+            self._clock += 1
+            self._last_used[term] = self._clock
+            self._uses[term] = 0
+        self._weights[term] = weight
+        if len(self._weights) > self.capacity:
+            self._evict()
+
+    def __delitem__(self, term):
+        del self._weights[term]
+        del self._last_used[term]
+        del self._uses[term]
+
+    def _evict(self):
+        target = len(self._weights) - int(self.capacity * self.low_water)
+        candidates = (term for term in self._weights if term not in self.pinned)
+        if self.policy == "weight":
+            victims = heapq.nsmallest(target, candidates, key=lambda t: abs(self._weights[t]))
+        elif self.policy == "lru":
+            victims = heapq.nsmallest(target, candidates, key=self._last_used.__getitem__)
+        else:
+            victims = heapq.nsmallest(target, candidates, key=lambda t: (self._uses[t], self._last_used[t]))
+        for term in victims:
+            del self[term]
+            if self.on_evict is not None:
+                self.on_evict(term)
+        self.evictions += len(victims)
+        self.eviction_runs += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "terms": len(self._weights),
+            "capacity": self.capacity,
+            "policy": self.policy,
+            "pinned": len(self.pinned),
+            "evictions": self.evictions,
+            "eviction_runs": self.eviction_runs,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,183 @@
+import argparse
+import os
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from lm_scorer import LMScorer, load_stopwords, preprocess_text
+from score_cache import default_score_cache
+
+
+@dataclass
+class TierStats:
+    name: str
+    count: int = 0
+    seconds: float = 0.0
+
+    @property
+    def docs_per_second(self):
+        return self.count / self.seconds if self.seconds else float("nan")
+
+
+@dataclass
+class CascadeReport:
+    total: int = 0
+    tiers: list = field(default_factory=list)
+
+    def __str__(self):
+        lines = [f"{'tier':>8} {'docs':>7} {'share':>7} {'seconds':>9} {'docs/s':>9}"]
+        for tier in self.tiers:
+            share = tier.count / self.total if self.total else 0.0
+            lines.append(f"{tier.name:>8} {tier.count:7d} {share:7.1%} {tier.seconds:9.3f} {tier.docs_per_second:9.1f}")
+        return "\n".join(lines)
+
+
+def _label(scores, cutoff):
+    return np.where(scores > cutoff, "positive", np.where(scores < -cutoff, "negative", "neutral"))
+
+
+class ScoringCascade:
+    """Lexicon -> FinBERT -> LLM scoring cascade.
+
+    Every text gets the Loughran-McDonald score. Texts whose lm_score2 lies
+    inside [-lexicon_band, lexicon_band], or that have fewer than `min_hits`
+    lexicon matches, go on to FinBERT. FinBERT results whose top-class
+    probability is below `finbert_confidence` are candidates for the LLM; the
+    least confident `llm_budget` of them (a count, or a fraction of all texts
+    when < 1) are sent. Either later tier is optional.
+    """
+
+    def __init__(self, lm_scorer, finbert_scorer=None, llm_scorer=None, stopwords=frozenset(),
+                 lexicon_band=0.3, min_hits=2, finbert_confidence=0.8, llm_budget=0.05):
+        self.lm_scorer = lm_scorer
+        self.finbert_scorer = finbert_scorer
+        self.llm_scorer = llm_scorer
+        self.stopwords = stopwords
+        self.lexicon_band = lexicon_band
+        self.min_hits = min_hits
+        self.finbert_confidence = finbert_confidence
+        self.llm_budget = llm_budget
+
+    def _llm_limit(self, total):
+        if self.llm_budget is None:
+            return total
+        if self.llm_budget < 1:
+            return int(np.ceil(self.llm_budget * total))
+        return int(self.llm_budget)
+
+    def score(self, texts):
+        """Return (DataFrame aligned with `texts`, CascadeReport)."""
+        texts = pd.Series(texts) if not isinstance(texts, pd.Series) else texts
+        report = CascadeReport(total=len(texts))
+        result = pd.DataFrame(index=texts.index)
+
+        # Tier 1: lexicon on everything
+        stats = TierStats("lexicon", count=len(texts))
+        start = time.perf_counter()
+        clean = [preprocess_text(text, self.stopwords) if isinstance(text, str) else "" for text in texts]
+        lm = self.lm_scorer.score(pd.Series(clean, index=texts.index))
+        stats.seconds = time.perf_counter() - start
+        report.tiers.append(stats)
+
+        lm_score = lm["lm_score2"].to_numpy(dtype=np.float64)
+        result["lm_score2"] = lm_score
+        result["cascade_tier"] = "lexicon"
+        result["cascade_score"] = np.nan_to_num(lm_score)
+        result["cascade_sentiment"] = _label(lm_score, self.lexicon_band)
+
+        hits = (lm["n_pos"] + lm["n_neg"]).to_numpy()
+        uncertain = np.isnan(lm_score) | (np.abs(lm_score) <= self.lexicon_band) | (hits < self.min_hits)
+        if self.finbert_scorer is None or not uncertain.any():
+            return result, report
+
+        # Tier 2: FinBERT on the lexicon's uncertainty band
+        stats = TierStats("finbert", count=int(uncertain.sum()))
+        start = time.perf_counter()
+        probs = self.finbert_scorer.predict_proba(texts[uncertain].tolist())
+        finbert = self.finbert_scorer.to_frame(probs, index=texts.index[uncertain])
+        stats.seconds = time.perf_counter() - start
+        report.tiers.append(stats)
+
+        result = result.join(finbert)
+        result.loc[finbert.index, "cascade_tier"] = "finbert"
+        result.loc[finbert.index, "cascade_score"] = finbert["finbert_score"]
+        result.loc[finbert.index, "cascade_sentiment"] = finbert["finbert_sentiment"]
+
+        confidence = probs.max(axis=1)
+        candidates = np.flatnonzero(confidence < self.finbert_confidence)
+        if self.llm_scorer is None or not len(candidates):
+            return result, report
+
+        # Tier 3: LLM on the least confident FinBERT results, within budget
+        hardest = candidates[np.argsort(confidence[candidates], kind="stable")][: self._llm_limit(len(texts))]
+        if not len(hardest):
+            return result, report
+        llm_index = finbert.index[np.sort(hardest)]
+
+        stats = TierStats("llm", count=len(llm_index))
+        start = time.perf_counter()
+        llm = pd.DataFrame(
+            self.llm_scorer.score(texts.loc[llm_index].tolist()),
+            index=llm_index,
+            columns=["llm_sentiment", "llm_score", "llm_justification", "llm_main_entity"],
+        )
+        stats.seconds = time.perf_counter() - start
+        report.tiers.append(stats)
+
+        result = result.join(llm)
+        ok = (llm["llm_sentiment"] != "error").to_numpy()
+        result.loc[llm.index[ok], "cascade_tier"] = "llm"
+        result.loc[llm.index[ok], "cascade_score"] = llm.loc[ok, "llm_score"].astype(float)
+        result.loc[llm.index[ok], "cascade_sentiment"] = llm.loc[ok, "llm_sentiment"]
+        return result, report
+
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Run the lexicon -> FinBERT -> LLM scoring cascade over a CSV of texts")
+    parser.add_argument("--csv", default=os.path.join(script_dir, "..", "finviz_sentiment_data.csv"))
+    parser.add_argument("--column", default="title", help="Text column to score")
+    parser.add_argument("--lexicon-band", type=float, default=0.3)
+    parser.add_argument("--min-hits", type=int, default=2)
+    parser.add_argument("--finbert-confidence", type=float, default=0.8)
+    parser.add_argument("--llm-budget", type=float, default=0.05, help="LLM calls: a count, or a fraction of texts if < 1")
+    parser.add_argument("--no-finbert", action="store_true")
+    parser.add_argument("--no-llm", action="store_true")
+    parser.add_argument("--no-score-cache", action="store_true", help="Do not reuse lexicon/FinBERT scores from earlier runs")
+    args = parser.parse_args()
+
+    texts = pd.read_csv(args.csv)[args.column].dropna().astype(str)
+    score_cache = None if args.no_score_cache else default_score_cache()
+    lm_scorer = LMScorer.from_csv(os.path.join(script_dir, "Loughran-McDonald_MasterDictionary_1993-2024.csv"), cache=score_cache)
+
+    finbert_scorer = None
+    if not args.no_finbert:
+        from finbert_scorer import FinBertScorer
+        finbert_scorer = FinBertScorer(chunked=True, cache=score_cache)
+
+    llm_scorer = None
+    if not args.no_llm:
+        from langchain_ollama import ChatOllama
+        from llm_scorer import LLMScorer
+        llm = ChatOllama(model="llama2", temperature=0.1, base_url=os.getenv("OLLAMA_HOST", "http://localhost:11434"))
+        llm_scorer = LLMScorer(llm, cache_dir=os.path.join(script_dir, "llm_cache"))
+
+    cascade = ScoringCascade(
+        lm_scorer,
+        finbert_scorer,
+        llm_scorer,
+        stopwords=load_stopwords(os.path.join(script_dir, "stopwords.txt")),
+        lexicon_band=args.lexicon_band,
+        min_hits=args.min_hits,
+        finbert_confidence=args.finbert_confidence,
+        llm_budget=args.llm_budget,
+    )
+    result, report = cascade.score(texts)
+
+    print(result[["cascade_tier", "cascade_sentiment", "cascade_score"]].join(texts).head(20))
+    print()
+    print(report)
+    if score_cache is not None:
+        print(score_cache.stats())
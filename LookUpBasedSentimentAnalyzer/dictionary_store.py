@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+
+
+class DictionaryStore:
+    """Crash-safe persistence for a learned {term: weight} dictionary.
+
+    The dictionary lives in a JSON snapshot plus an append-only delta log of
+    JSON lines `[term, weight]` (weight None means the term was removed).
+    save() appends only the terms changed since the last save, so a poll costs
+    O(changed terms) instead of O(vocabulary). Once the log is longer than
+    `compact_ratio` times the vocabulary (and at least `compact_min` lines) it
+    is folded into a new snapshot, written to a temp file, fsynced and
+    os.replace()d into place, so readers only ever see a complete file.
+
+    Deltas hold absolute weights, so replaying a delta that already made it
+    into the snapshot is harmless; a torn last line from a crash mid-append is
+    skipped on load.
+    """
+
+    def __init__(self, snapshot_path, delta_path=None, compact_ratio=1.0, compact_min=10_000):
+        self.snapshot_path = snapshot_path
+        self.delta_path = delta_path or os.path.splitext(snapshot_path)[0] + '.delta.jsonl'
+        self.compact_ratio = compact_ratio
+        self.compact_min = compact_min
+        self.delta_lines = 0
+        self._lock = threading.Lock()
+
+    def exists(self):
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.delta_path)
+
+    def load(self):
+        """Snapshot with the delta log replayed on top, or None if nothing was saved yet."""
+        if not self.exists():
+            return None
+        terms = {}
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as f:
+                terms = {k: float(v) for k, v in json.load(f).items()}
+        self.delta_lines = 0
+        if os.path.exists(self.delta_path):
+            with open(self.delta_path, 'rb+') as f:
+                data = f.read()
+                complete = data.rfind(b'\n') + 1
+                if complete < len(data):
+                    # Torn write at the tail: cut it off so the next append starts on a fresh line
+                    f.truncate(complete)
+            for line in data[:complete].splitlines():
+                try:
+                    term, weight = json.loads(line)
+                except ValueError:
+                    continue
+                self.delta_lines += 1
+                if weight is None:
+                    terms.pop(term, None)
+                else:
+                    terms[term] = float(weight)
+        return terms
+
+    def save(self, terms, changed):
+        """Persist the weights of `changed` terms (terms missing from `terms` are logged as removed)."""
+        with self._lock:
+            if not os.path.exists(self.snapshot_path):
+                self._compact(terms)
+                return
+            if changed:
+                lines = [json.dumps([term, terms[term] if term in terms else None]) + '\n' for term in changed]
+                with open(self.delta_path, 'a', encoding='utf-8') as f:
+                    f.writelines(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.delta_lines += len(lines)
+            if self.delta_lines > max(self.compact_min, self.compact_ratio * len(terms)):
+                self._compact(terms)
+
+    def compact(self, terms):
+        """Write a fresh snapshot of `terms` and drop the delta log."""
+        with self._lock:
+            self._compact(terms)
+
+    def _compact(self, terms):
+        tmp_path = f'{self.snapshot_path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(dict(terms), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # Only after the snapshot is in place; a crash in between just replays redundant deltas
+        if os.path.exists(self.delta_path):
+            os.remove(self.delta_path)
+        self.delta_lines = 0
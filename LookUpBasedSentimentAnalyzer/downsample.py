@@ -0,0 +1,38 @@
+import numpy as np
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling; returns the indices of the points to keep.
+
+    Keeps the first and last point and, for each of the n_out - 2 buckets in
+    between, the point forming the largest triangle with the previously kept
+    point and the mean of the next bucket. Peaks and troughs survive, unlike
+    with plain striding or averaging. `x` must be sorted and numeric
+    (e.g. timestamps as int64 nanoseconds).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket boundaries over the points between the fixed first and last ones
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], max(edges[i + 1], edges[i] + 1)
+        if i + 2 < len(edges):
+            next_start, next_stop = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            avg_x, avg_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((x[prev] - avg_x) * (y[start:stop] - y[prev]) - (x[prev] - x[start:stop]) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        keep[i + 1] = prev
+    return keep
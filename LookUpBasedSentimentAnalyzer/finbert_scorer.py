@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+import scipy
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+FINBERT_MODEL = "ProsusAI/finbert"
+FINBERT_COLUMNS = ["finbert_pos", "finbert_neg", "finbert_neu", "finbert_sentiment", "finbert_score"]
+BACKENDS = ("torch", "int8", "onnx")
+
+
+def load_model(model_name=FINBERT_MODEL, backend="torch"):
+    """Load the classifier for a CPU backend.
+
+    "torch" is the fp32 eager model, "int8" applies dynamic int8 quantization
+    to its Linear layers, and "onnx" exports the model to an ONNX Runtime
+    graph (needs `pip install optimum[onnxruntime]`).
+    """
+    if backend == "torch":
+        return AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+    if backend == "int8":
+        model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if backend == "onnx":
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+        except ImportError as e:
+            raise ImportError("The onnx backend needs optimum with onnxruntime: pip install optimum[onnxruntime]") from e
+        return ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+
+
+class FinBertScorer:
+    """Batched FinBERT inference.
+
+    Texts are tokenized once, sorted by token length and run through the model
+    in micro-batches of `batch_size`, so each batch is padded only to its own
+    longest member. Softmax is applied once per batch.
+
+    With `chunked=True` documents longer than `max_length` tokens are split
+    into overlapping windows (`stride` tokens of overlap) instead of being
+    truncated. Windows from all documents share the same length-sorted
+    batches, and the window probabilities are averaged back per document,
+    weighted by window token count (`aggregate="length"`) or by the window's
+    top-class probability (`aggregate="confidence"`).
+
+    `backend` selects the CPU runtime, see load_model.
+
+    With a ScoreCache as `cache`, probabilities are memoized per text under a
+    version built from the model and windowing settings; only unseen texts
+    reach the model.
+    """
+
+    def __init__(self, model_name=FINBERT_MODEL, batch_size=16, max_length=512, tokenizer=None, model=None,
+                 chunked=False, stride=64, aggregate="length", backend="torch", cache=None):
+        if aggregate not in ("length", "confidence"):
+            raise ValueError(f"aggregate must be 'length' or 'confidence', got {aggregate!r}")
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.chunked = chunked
+        self.stride = stride
+        self.aggregate = aggregate
+        self.backend = backend
+        self.cache = cache
+        self.cache_version = f"{model_name}|{backend}|{max_length}|{chunked}|{stride}|{aggregate}"
+        self.tokenizer = tokenizer if tokenizer is not None else AutoTokenizer.from_pretrained(model_name)
+        self.model = model if model is not None else load_model(model_name, backend)
+        if isinstance(self.model, torch.nn.Module):
+            self.model.eval()
+
+        id2label = self.model.config.id2label
+        self.labels = np.array([id2label[i] for i in range(len(id2label))], dtype=object)
+        self._label_ids = {label: i for i, label in enumerate(self.labels)}
+
+    def _encode(self, texts):
+        if self.chunked:
+            return self.tokenizer(
+                texts,
+                truncation=True,
+                max_length=self.max_length,
+                stride=self.stride,
+                return_overflowing_tokens=True,
+            )
+        return self.tokenizer(texts, truncation=True, max_length=self.max_length)
+
+    def _batches(self, encoded, order):
+        keys = [k for k in encoded.keys() if k != "overflow_to_sample_mapping"]
+        for start in range(0, len(order), self.batch_size):
+            batch_ids = order[start:start + self.batch_size]
+            features = [{k: encoded[k][i] for k in keys} for i in batch_ids]
+            yield batch_ids, self.tokenizer.pad(features, return_tensors="pt")
+
+    def _forward(self, inputs):
+        return self.model(**inputs).logits
+
+    def predict_proba(self, texts):
+        """Return an (n_texts, n_labels) array of class probabilities, in model label order."""
+        texts = [text if isinstance(text, str) else "" for text in texts]
+        if self.cache is None:
+            return self._predict_proba(texts)
+
+        probs = self.cache.memoize("finbert", self.cache_version, texts, lambda misses: self._predict_proba(misses).tolist())
+        return np.asarray(probs, dtype=np.float32).reshape(len(texts), len(self.labels))
+
+    def _predict_proba(self, texts):
+        probs = np.zeros((len(texts), len(self.labels)), dtype=np.float32)
+        if not texts:
+            return probs
+
+        encoded = self._encode(texts)
+        n_windows = len(encoded["input_ids"])
+        lengths = np.fromiter((len(ids) for ids in encoded["input_ids"]), dtype=np.int64, count=n_windows)
+        # Length buckets: neighbouring inputs in this order have similar token counts
+        order = np.argsort(lengths, kind="stable")
+
+        window_probs = np.zeros((n_windows, len(self.labels)), dtype=np.float32)
+        with torch.inference_mode():
+            for batch_ids, inputs in self._batches(encoded, order):
+                logits = self._forward(inputs)
+                window_probs[batch_ids] = scipy.special.softmax(logits.float().numpy(), axis=1)
+
+        if not self.chunked:
+            return window_probs
+
+        doc_ids = np.asarray(encoded["overflow_to_sample_mapping"], dtype=np.int64)
+        if self.aggregate == "confidence":
+            weights = window_probs.max(axis=1).astype(np.float64)
+        else:
+            weights = lengths.astype(np.float64)
+
+        totals = np.bincount(doc_ids, weights=weights, minlength=len(texts))
+        for j in range(len(self.labels)):
+            probs[:, j] = np.bincount(doc_ids, weights=weights * window_probs[:, j], minlength=len(texts))
+        probs /= np.maximum(totals, np.finfo(np.float64).tiny)[:, None]
+        return probs
+
+    def to_frame(self, probs, index=None):
+        pos = probs[:, self._label_ids["positive"]]
+        neg = probs[:, self._label_ids["negative"]]
+        neu = probs[:, self._label_ids["neutral"]]
+        return pd.DataFrame(
+            {
+                "finbert_pos": pos,
+                "finbert_neg": neg,
+                "finbert_neu": neu,
+                "finbert_sentiment": self.labels[probs.argmax(axis=1)],
+                "finbert_score": pos - neg,
+            },
+            index=index,
+        )
+
+    def score(self, texts):
+        """Score a column of raw texts; returns the finbert_* columns aligned with the input."""
+        index = texts.index if isinstance(texts, pd.Series) else None
+        return self.to_frame(self.predict_proba(list(texts)), index=index)
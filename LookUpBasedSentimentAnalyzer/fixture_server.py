@@ -0,0 +1,79 @@
+import gzip
+import hashlib
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# One well-formed channel; the repeated items give the body enough bytes for gzip to matter
+SAMPLE_FEED = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel><title>Fixture feed</title>\n'
+    + b"".join(
+        b"<item><title>Acme beats earnings estimates</title><link>http://fixture.local/a%d</link></item>\n"
+        b"<item><title>Acme shares slump on weak guidance</title><link>http://fixture.local/b%d</link></item>\n"
+        % (i, i)
+        for i in range(20)
+    )
+    + b"</channel></rss>\n"
+)
+
+
+class FixtureServer:
+    """Local HTTP server for exercising Fetcher without the network.
+
+    `routes` maps a path to (body bytes, content type). Every response carries
+    an ETag and Last-Modified and answers 304 to matching validators; bodies
+    are gzip-compressed when the client accepts it. `hits` counts requests
+    per path. Use as a context manager; url(path) gives the absolute URL.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.hits = {}
+        self.last_modified = formatdate(usegmt=True)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.hits[self.path] = server.hits.get(self.path, 0) + 1
+                if self.path not in server.routes:
+                    self.send_error(404)
+                    return
+                body, content_type = server.routes[self.path]
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+
+                if self.headers.get('If-None-Match') == etag or self.headers.get('If-Modified-Since') == server.last_modified:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    body = gzip.compress(body)
+                    self.send_response(200)
+                    self.send_header('Content-Encoding', 'gzip')
+                else:
+                    self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', server.last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def url(self, path):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,141 @@
+import re
+
+from bs4 import BeautifulSoup
+
+# Fast parsers are optional; BeautifulSoup's html.parser is always available as the fallback
+# selectolax 1.0 dropped the Modest `parser` module; the Lexbor parser has the same node API
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+try:
+    import lxml.html
+    import lxml.etree
+except ImportError:
+    lxml = None
+
+BACKENDS = ("selectolax", "lxml", "bs4")
+
+WHITESPACE_RE = re.compile(r'\s+')
+YAHOO_ITEM_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' Ov(h) ')]"
+YAHOO_DATE_XPATH = ".//span[contains(concat(' ', normalize-space(@class), ' '), ' C($tertiaryColor) ')]"
+
+
+def available_backends():
+    return [b for b in BACKENDS if b == "bs4" or (b == "selectolax" and HTMLParser) or (b == "lxml" and lxml)]
+
+
+def default_backend():
+    return available_backends()[0]
+
+
+def _check(backend):
+    backend = backend or default_backend()
+    if backend not in available_backends():
+        raise ValueError(f"HTML backend {backend!r} is not available, choose from {available_backends()}")
+    return backend
+
+
+def describe_backend(backend=None):
+    """The backend that `backend` resolves to and the parser behind it, e.g. for benchmark output."""
+    backend = _check(backend)
+    if backend == "selectolax":
+        return f"selectolax ({HTMLParser.__module__}.{HTMLParser.__name__})"
+    if backend == "lxml":
+        return f"lxml {lxml.etree.__version__}"
+    return "bs4 (html.parser)"
+
+
+def _join_text(chunks):
+    # Same result as BeautifulSoup get_text(separator=' ', strip=True) followed by whitespace collapsing
+    return WHITESPACE_RE.sub(' ', ' '.join(c.strip() for c in chunks if c and c.strip())).strip()
+
+
+def extract_article_text(html, backend=None):
+    """Visible text of a page with scripts and styles removed, whitespace collapsed."""
+    backend = _check(backend)
+    if not html:
+        return ""
+
+    if backend == "selectolax":
+        tree = HTMLParser(html)
+        tree.strip_tags(["script", "style"])
+        root = tree.root
+        return _join_text(node.text_content for node in root.traverse(include_text=True) if node.tag == "-text") if root else ""
+
+    if backend == "lxml":
+        doc = lxml.html.fromstring(html)
+        for element in list(doc.iter("script", "style", lxml.etree.Comment)):
+            element.drop_tree()
+        return _join_text(doc.itertext())
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for script in soup(["script", "style"]):
+        script.decompose()
+    return _join_text(soup.stripped_strings)
+
+
+def extract_yahoo_news_items(html, backend=None):
+    """Parse a Yahoo Finance quote news page into raw items.
+
+    Returns dicts with title, href, summary (None when missing) and date_str
+    (None when missing) for every `div.Ov(h)` that has a heading and a link.
+    """
+    backend = _check(backend)
+    if backend == "selectolax":
+        # selectolax has no XPath; its CSS engine handles the escaped class names fine
+        tree = HTMLParser(html)
+        items = []
+        for item in tree.css("div.Ov\\(h\\)"):
+            title_elem = item.css_first("h3")
+            link_elem = item.css_first("a")
+            if title_elem is None or link_elem is None or "href" not in link_elem.attributes:
+                continue
+            summary_elem = item.css_first("p")
+            date_elem = item.css_first("span.C\\(\\$tertiaryColor\\)")
+            items.append({
+                'title': title_elem.text().strip(),
+                'href': link_elem.attributes.get('href') or "",
+                'summary': summary_elem.text().strip() if summary_elem is not None else None,
+                'date_str': date_elem.text().strip() if date_elem is not None else None,
+            })
+        return items
+
+    if backend == "lxml":
+        doc = lxml.html.fromstring(html) if html else None
+        items = []
+        for item in (doc.xpath(YAHOO_ITEM_XPATH) if doc is not None else []):
+            title_elem = next(item.iter("h3"), None)
+            links = item.xpath(".//a")
+            if title_elem is None or not links or "href" not in links[0].attrib:
+                continue
+            summary_elem = next(item.iter("p"), None)
+            dates = item.xpath(YAHOO_DATE_XPATH)
+            items.append({
+                'title': title_elem.text_content().strip(),
+                'href': links[0].get('href'),
+                'summary': summary_elem.text_content().strip() if summary_elem is not None else None,
+                'date_str': dates[0].text_content().strip() if dates else None,
+            })
+        return items
+
+    soup = BeautifulSoup(html, 'html.parser')
+    items = []
+    for item in soup.find_all('div', {'class': 'Ov(h)'}):
+        title_elem = item.find('h3')
+        link_elem = item.find('a')
+        if not title_elem or not link_elem or not link_elem.has_attr('href'):
+            continue
+        summary_elem = item.find('p')
+        date_elem = item.find('span', {'class': 'C($tertiaryColor)'})
+        items.append({
+            'title': title_elem.text.strip(),
+            'href': link_elem['href'],
+            'summary': summary_elem.text.strip() if summary_elem else None,
+            'date_str': date_elem.text.strip() if date_elem else None,
+        })
+    return items
@@ -0,0 +1,128 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+class HostRateLimiter:
+    """Spaces requests to the same host at least `min_interval` seconds apart."""
+
+    def __init__(self, min_interval=0.0):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host):
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Fetcher:
+    """Shared HTTP client for feeds and article pages.
+
+    One keep-alive connection pool serves every caller. Feed requests carry
+    the ETag / Last-Modified validators of the previous response, and a 304
+    reply skips both the download and the feedparser pass. Responses are
+    requested gzip-compressed and requests to one host are rate limited.
+    """
+
+    def __init__(self, user_agent=USER_AGENT, pool_maxsize=32, min_host_interval=0.0, timeout=10):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': user_agent, 'Accept-Encoding': 'gzip, deflate'})
+        self.rate_limiter = HostRateLimiter(min_host_interval)
+
+        self._validators = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+        self.parses_skipped = 0
+        self.bytes_transferred = 0
+        self.errors = 0
+
+    def _count(self, **increments):
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def get(self, url, conditional=False, timeout=None, **kwargs):
+        """GET `url`. With conditional=True returns None when the server answers 304 Not Modified."""
+        headers = dict(kwargs.pop('headers', None) or {})
+        if conditional:
+            etag, last_modified = self._validators.get(url, (None, None))
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        self.rate_limiter.wait(urlsplit(url).netloc)
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout or self.timeout, **kwargs)
+        except requests.RequestException:
+            self._count(requests=1, errors=1)
+            raise
+
+        # Bytes pulled over the wire (compressed), falling back to the decoded body size
+        content = response.content
+        try:
+            transferred = response.raw.tell() or len(content)
+        except Exception:
+            transferred = len(content)
+        self._count(requests=1, bytes_transferred=transferred)
+
+        if response.status_code == 304:
+            self._count(not_modified=1)
+            return None
+
+        if conditional and response.ok:
+            validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            if any(validators):
+                self._validators[url] = validators
+        return response
+
+    def fetch_feed(self, url, timeout=None):
+        """Fetch and parse an RSS/Atom feed, or return None if it has not changed since the last fetch."""
+        response = self.get(url, conditional=True, timeout=timeout)
+        if response is None:
+            self._count(parses_skipped=1)
+            return None
+        response.raise_for_status()
+        # feedparser looks headers up by lower-case name (e.g. for the content type and charset)
+        return feedparser.parse(response.content, response_headers={k.lower(): v for k, v in response.headers.items()})
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'not_modified': self.not_modified,
+                'parses_skipped': self.parses_skipped,
+                'bytes_transferred': self.bytes_transferred,
+                'errors': self.errors,
+            }
+
+
+_default_fetcher = None
+_default_lock = threading.Lock()
+
+
+def default_fetcher():
+    """Process-wide Fetcher used when an analyzer is not given one explicitly."""
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = Fetcher()
+        return _default_fetcher
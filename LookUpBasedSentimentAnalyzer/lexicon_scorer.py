@@ -0,0 +1,62 @@
+import re
+
+import numpy as np
+
+NEGATIONS = frozenset(["not", "no", "never", "without", "barely", "hardly", "doesn't", "isn't", "aren't", "wasn't", "weren't"])
+NEGATION_FILLERS = frozenset(['a', 'the', 'an', 'very', 'so', 'quite'])
+
+WORD_RE = re.compile(r'\w+')
+
+
+class LexiconScorer:
+    """Compiled version of SentimentAnalyzer.score_with_dictionary.
+
+    Holds a reference to the sentiment dictionary (not a copy), so weights
+    learned by update_dictionary are picked up on the next call.
+    """
+
+    def __init__(self, sentiment_dict):
+        self.sentiment_dict = sentiment_dict
+
+    def tokenize(self, text):
+        text = text.lower()
+        words = text.split()
+
+        # Fast path: nothing to negate, tokenize the whole text in one regex pass
+        if NEGATIONS.isdisjoint(words) or (words[-1] in NEGATIONS and NEGATIONS.isdisjoint(words[:-1])):
+            return WORD_RE.findall(text)
+
+        # Single pass negation marking: a negation tags the next non-filler word
+        # with NOT_. A tagged word is no longer a negation itself, which matches
+        # the in-place rewrite done by score_with_dictionary.
+        marked = []
+        pending = False
+        for word in words:
+            if pending:
+                if word in NEGATION_FILLERS:
+                    marked.append(word)
+                    continue
+                marked.append(f"NOT_{word}")
+                pending = False
+                continue
+            if word in NEGATIONS:
+                pending = True
+            marked.append(word)
+
+        return WORD_RE.findall(' '.join(marked))
+
+    def score(self, text):
+        words = self.tokenize(text)
+        if not words:
+            return 0
+
+        lookup = self.sentiment_dict.get
+        score = sum(lookup(word, 0) for word in words)
+
+        # Normalize by text length
+        return score / (len(words) ** 0.5)
+
+    def score_batch(self, texts):
+        if not isinstance(texts, (list, tuple)):
+            texts = list(texts)
+        return np.fromiter((self.score(text) for text in texts), dtype=np.float64, count=len(texts))
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel, Field
+from langchain_core.prompts import PromptTemplate
+from langchain_core.output_parsers import PydanticOutputParser
+from tenacity import Retrying, stop_after_attempt, wait_exponential_jitter, RetryError
+
+# The news text sits between these markers so it can be told apart from the format instructions
+NEWS_START = "<news>"
+NEWS_END = "</news>"
+PROMPT_TEMPLATE = "Describe the sentiment of a text of financial news.\n{format_instructions}\n" + NEWS_START + "\n{news}\n" + NEWS_END + "\n"
+# Bump whenever the template or SentimentClassification changes, so cached answers are not reused
+PROMPT_VERSION = "2"
+
+ERROR_RESULT = ("error", 0, "", "")
+
+
+class SentimentClassification(BaseModel):
+    sentiment: str = Field(
+        ...,
+        description="The sentiment of the text",
+        enum=["positive", "negative", "neutral"],
+    )
+    score: float = Field(..., description="The score of the sentiment", ge=-1, le=1)
+    justification: str = Field(..., description="The justification of the sentiment")
+    main_entity: str = Field(..., description="The main entity discussed in the text")
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LLMResultCache:
+    """One JSON file per (model, prompt version, text hash) under `path`."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, model: str, prompt_version: str, digest: str) -> str:
+        key = hashlib.sha256(f"{model}\0{prompt_version}\0{digest}".encode("utf-8")).hexdigest()
+        return os.path.join(self.path, key[:2], f"{key}.json")
+
+    def get(self, model: str, prompt_version: str, digest: str):
+        try:
+            with open(self._file(model, prompt_version, digest), "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put(self, model: str, prompt_version: str, digest: str, result: dict):
+        path = self._file(model, prompt_version, digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp-{os.getpid()}-{id(result)}"
+        with open(tmp_path, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+
+
+class LLMScorer:
+    """Batch LLM sentiment classification.
+
+    The parser, prompt and chain are built once. Texts not found in the
+    result cache are classified with up to `max_concurrency` requests in
+    flight, each retried with exponential backoff.
+    """
+
+    def __init__(self, llm, model_name: str = None, prompt_version: str = PROMPT_VERSION, cache_dir: str = None,
+                 max_concurrency: int = 4, max_attempts: int = 5, backoff_initial: float = 1.0,
+                 backoff_max: float = 30.0):
+        self.model_name = model_name or getattr(llm, "model", None) or type(llm).__name__
+        self.prompt_version = prompt_version
+        self.cache = LLMResultCache(cache_dir) if cache_dir else None
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.cache_hits = 0
+        self.requests = 0
+
+        parser = PydanticOutputParser(pydantic_object=SentimentClassification)
+        prompt = PromptTemplate(
+            template=PROMPT_TEMPLATE,
+            input_variables=["news"],
+            partial_variables={"format_instructions": parser.get_format_instructions()},
+        )
+        self.chain = prompt | llm | parser
+
+    def _run_chain(self, text: str) -> dict:
+        retrying = Retrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=wait_exponential_jitter(initial=self.backoff_initial, max=self.backoff_max),
+        )
+        for attempt in retrying:
+            with attempt:
+                return self.chain.invoke({"news": text}).dict()
+
+    def _classify(self, text: str, digest: str) -> tuple[str, float, str, str]:
+        try:
+            result = self._run_chain(text)
+        except RetryError as e:
+            print(f"Error: {e}")
+            return ERROR_RESULT
+
+        if self.cache is not None:
+            self.cache.put(self.model_name, self.prompt_version, digest, result)
+        return result["sentiment"], result["score"], result["justification"], result["main_entity"]
+
+    def score(self, texts) -> list[tuple[str, float, str, str]]:
+        texts = list(texts)
+        digests = [text_hash(text) for text in texts]
+        results = {}
+
+        pending = {}
+        for text, digest in zip(texts, digests):
+            if digest in results or digest in pending:
+                continue
+            cached = self.cache.get(self.model_name, self.prompt_version, digest) if self.cache else None
+            if cached is not None:
+                self.cache_hits += 1
+                results[digest] = (cached["sentiment"], cached["score"], cached["justification"], cached["main_entity"])
+            else:
+                pending[digest] = text
+
+        if pending:
+            self.requests += len(pending)
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                futures = {digest: pool.submit(self._classify, text, digest) for digest, text in pending.items()}
+                for digest, future in futures.items():
+                    results[digest] = future.result()
+
+        return [results[digest] for digest in digests]
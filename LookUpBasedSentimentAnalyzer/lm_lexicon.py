@@ -0,0 +1,172 @@
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+CATEGORIES = ["Negative", "Positive", "Uncertainty", "Litigious", "Strong_Modal", "Weak_Modal", "Constraining", "Complexity"]
+CACHE_VERSION = 1
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_paths(csv_path):
+    base = os.path.splitext(csv_path)[0]
+    return f"{base}.lmcache.npy", f"{base}.lmcache.json"
+
+
+def _write_atomic(path, write):
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def compile_lexicon(csv_path):
+    """Compile the LM master dictionary CSV into a sorted, memory-mappable record array.
+
+    Each record holds the lowercased word and a bitmask with one bit per
+    category in CATEGORIES (bit set when the CSV column is non-zero).
+    """
+    columns = pd.read_csv(csv_path, nrows=0).columns
+    categories = [c for c in CATEGORIES if c in columns]
+    lm_dict = pd.read_csv(csv_path, usecols=["Word"] + categories, keep_default_na=False)
+
+    words = lm_dict["Word"].astype(str).str.lower()
+    flags = np.zeros(len(lm_dict), dtype=np.uint16)
+    for bit, category in enumerate(categories):
+        flags[lm_dict[category].to_numpy() != 0] |= np.uint16(1 << bit)
+
+    # Only words that belong to at least one category are needed for lookups
+    keep = flags != 0
+    encoded = words[keep].str.encode("utf-8").to_numpy()
+    width = max((len(w) for w in encoded), default=1)
+    records = np.empty(len(encoded), dtype=[("word", f"S{width}"), ("flags", "<u2")])
+    records["word"] = encoded
+    records["flags"] = flags[keep]
+    records.sort(order="word")
+
+    npy_path, meta_path = cache_paths(csv_path)
+    stat = os.stat(csv_path)
+    meta = {
+        "version": CACHE_VERSION,
+        "csv_sha256": file_sha256(csv_path),
+        "csv_size": stat.st_size,
+        "csv_mtime": stat.st_mtime,
+        "categories": categories,
+        "rows": len(records),
+    }
+    _write_atomic(npy_path, lambda f: np.save(f, records))
+    _write_atomic(meta_path, lambda f: f.write(json.dumps(meta).encode("utf-8")))
+    return meta
+
+
+def _cache_is_fresh(csv_path, meta, meta_path):
+    if meta.get("version") != CACHE_VERSION:
+        return False
+    stat = os.stat(csv_path)
+    if stat.st_size == meta.get("csv_size") and stat.st_mtime == meta.get("csv_mtime"):
+        return True
+    # Touched but possibly unchanged: fall back to the content hash
+    if stat.st_size != meta.get("csv_size") or file_sha256(csv_path) != meta.get("csv_sha256"):
+        return False
+    # Same content: remember the new mtime so later loads skip the hash again
+    meta["csv_mtime"] = stat.st_mtime
+    _write_atomic(meta_path, lambda f: f.write(json.dumps(meta).encode("utf-8")))
+    return True
+
+
+class LMLexicon:
+    """Read-only view over a compiled LM dictionary.
+
+    The record array is memory-mapped, so every worker loading the same cache
+    shares the page cache instead of holding a private DataFrame.
+    """
+
+    def __init__(self, records, categories, version=None):
+        self.records = records
+        # Identifies the source dictionary (its CSV hash), e.g. for score caches
+        self.version = version
+        self.categories = list(categories)
+        self._bits = {category: np.uint16(1 << bit) for bit, category in enumerate(self.categories)}
+        self._width = records.dtype["word"].itemsize
+
+    def __len__(self):
+        return len(self.records)
+
+    def category_bit(self, category):
+        try:
+            return self._bits[category]
+        except KeyError:
+            raise KeyError(f"Unknown LM category {category!r}, expected one of {self.categories}") from None
+
+    def words(self, category):
+        bit = self.category_bit(category)
+        selected = self.records["word"][(self.records["flags"] & bit) != 0]
+        return [w.decode("utf-8") for w in selected]
+
+    def flags(self, tokens):
+        """Return the category bitmask for each token (0 when not in the dictionary)."""
+        encoded = [t.encode("utf-8") if isinstance(t, str) else b"" for t in tokens]
+        result = np.zeros(len(encoded), dtype=np.uint16)
+        if not encoded or not len(self.records):
+            return result
+
+        fits = np.fromiter((0 < len(w) <= self._width for w in encoded), dtype=bool, count=len(encoded))
+        queries = np.array([w for w, ok in zip(encoded, fits) if ok], dtype=f"S{self._width}")
+        if not len(queries):
+            return result
+
+        words = self.records["word"]
+        pos = np.searchsorted(words, queries)
+        pos = np.minimum(pos, len(words) - 1)
+        found = words[pos] == queries
+        hits = np.zeros(len(queries), dtype=np.uint16)
+        hits[found] = self.records["flags"][pos[found]]
+        result[fits] = hits
+        return result
+
+    def contains(self, tokens, category):
+        return (self.flags(tokens) & self.category_bit(category)) != 0
+
+
+def load_lexicon(csv_path, compile_missing=True):
+    """Load the compiled cache for `csv_path`, (re)compiling it if missing or stale."""
+    npy_path, meta_path = cache_paths(csv_path)
+    meta = None
+    try:
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass
+
+    if meta is None or not os.path.exists(npy_path) or not _cache_is_fresh(csv_path, meta, meta_path):
+        if not compile_missing:
+            raise FileNotFoundError(f"No up-to-date LM cache for {csv_path}")
+        meta = compile_lexicon(csv_path)
+
+    records = np.load(npy_path, mmap_mode="r")
+    return LMLexicon(records, meta["categories"], version=meta["csv_sha256"])
+
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Compile the Loughran-McDonald dictionary into a memory-mapped cache")
+    parser.add_argument(
+        "csv",
+        nargs="?",
+        default=os.path.join(script_dir, "Loughran-McDonald_MasterDictionary_1993-2024.csv"),
+        help="Path to the LM master dictionary CSV",
+    )
+    args = parser.parse_args()
+
+    meta = compile_lexicon(args.csv)
+    print(f"Compiled {meta['rows']} words in {len(meta['categories'])} categories to {cache_paths(args.csv)[0]}")
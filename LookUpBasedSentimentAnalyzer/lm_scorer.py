@@ -0,0 +1,124 @@
+import hashlib
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from lm_lexicon import load_lexicon
+
+
+def load_stopwords(path):
+    with open(path, "r") as f:
+        return frozenset(f.read().split("\n")[:-1])
+
+
+def preprocess_text(text, stopwords):
+    words = text.lower().split()
+    return " ".join(w for w in words if w not in stopwords and w.isalpha())
+
+
+class LMScorer:
+    """Loughran-McDonald word-count scorer.
+
+    The lexicon is indexed once; scoring factorizes all tokens of a column into
+    token ids, looks each distinct token up a single time and counts hits per
+    document with np.bincount.
+
+    With a ScoreCache as `cache`, per-text counts are memoized under the
+    lexicon's version, so headlines seen in earlier polls or by other tickers
+    are not tokenized again.
+    """
+
+    def __init__(self, pos_words=(), neg_words=(), lexicon=None, cache=None):
+        self.lexicon = lexicon
+        self.cache = cache
+        self.pos_index = pd.Index(pd.unique(pd.Series(list(pos_words), dtype=object).dropna()))
+        self.neg_index = pd.Index(pd.unique(pd.Series(list(neg_words), dtype=object).dropna()))
+        self._version = None
+
+    @classmethod
+    def from_csv(cls, path, use_cache=True, cache=None):
+        if use_cache:
+            # Memory-mapped compiled dictionary, rebuilt when the CSV changes
+            return cls(lexicon=load_lexicon(path), cache=cache)
+
+        # Same parsing as the compiled cache: words such as "null" and "nan" stay words
+        lm_dict = pd.read_csv(path, usecols=["Word", "Positive", "Negative"], keep_default_na=False)
+        pos_words = lm_dict[lm_dict["Positive"] != 0]["Word"].str.lower()
+        neg_words = lm_dict[lm_dict["Negative"] != 0]["Word"].str.lower()
+        return cls(pos_words, neg_words, cache=cache)
+
+    @property
+    def cache_version(self):
+        """Changes whenever the word lists do, so cached counts never outlive their lexicon."""
+        if self._version is None:
+            if self.lexicon is not None and self.lexicon.version:
+                self._version = self.lexicon.version
+            else:
+                digest = hashlib.sha256()
+                for words in (self.pos_index, self.neg_index):
+                    digest.update("\n".join(sorted(words)).encode("utf-8"))
+                    digest.update(b"\0")
+                self._version = digest.hexdigest()
+        return self._version
+
+    def _lookup(self, uniques):
+        if self.lexicon is not None:
+            flags = self.lexicon.flags(uniques)
+            return (
+                (flags & self.lexicon.category_bit("Positive")) != 0,
+                (flags & self.lexicon.category_bit("Negative")) != 0,
+            )
+        return self.pos_index.get_indexer(uniques) >= 0, self.neg_index.get_indexer(uniques) >= 0
+
+    def count(self, texts):
+        """Return n, n_pos and n_neg arrays for an iterable of whitespace-tokenized texts."""
+        if self.cache is None:
+            return self._count(texts)
+
+        texts = [text if isinstance(text, str) else "" for text in texts]
+        counts = self.cache.memoize("lm", self.cache_version, texts, lambda misses: np.column_stack(self._count(misses)).tolist())
+        counts = np.asarray(counts, dtype=np.int64).reshape(len(texts), 3)
+        return counts[:, 0], counts[:, 1], counts[:, 2]
+
+    def _count(self, texts):
+        token_lists = [text.split() if isinstance(text, str) else [] for text in texts]
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+        tokens = np.fromiter(itertools.chain.from_iterable(token_lists), dtype=object, count=int(lengths.sum()))
+
+        codes, uniques = pd.factorize(tokens)
+        is_pos, is_neg = self._lookup(uniques)
+
+        doc_ids = np.repeat(np.arange(len(token_lists)), lengths)
+        n_pos = np.bincount(doc_ids[is_pos[codes]], minlength=len(token_lists))
+        n_neg = np.bincount(doc_ids[is_neg[codes]], minlength=len(token_lists))
+        return lengths, n_pos, n_neg
+
+    def score(self, texts, chunksize=100_000):
+        """Score a column of preprocessed texts.
+
+        Returns a DataFrame aligned with `texts` holding n, n_pos, n_neg,
+        lm_level, lm_score1 and lm_score2. Large inputs are processed in
+        chunks of `chunksize` documents to bound the token buffer.
+        """
+        texts = pd.Series(texts) if not isinstance(texts, pd.Series) else texts
+
+        parts = []
+        for start in range(0, len(texts), chunksize):
+            chunk = texts.iloc[start:start + chunksize]
+            n, n_pos, n_neg = self.count(chunk)
+            parts.append(pd.DataFrame({"n": n, "n_pos": n_pos, "n_neg": n_neg}, index=chunk.index))
+
+        if parts:
+            result = pd.concat(parts)
+        else:
+            result = pd.DataFrame({"n": [], "n_pos": [], "n_neg": []}, index=texts.index, dtype=np.int64)
+
+        result["lm_level"] = result["n_pos"] - result["n_neg"]
+        result["lm_score1"] = result["lm_level"] / result["n"]
+        result["lm_score2"] = result["lm_level"] / (result["n_pos"] + result["n_neg"])
+        return result
+
+
+def lm_sentiment(scores, cutoff=0.3):
+    return np.where(scores > cutoff, "positive", np.where(scores < -cutoff, "negative", "neutral"))
@@ -1,77 +1,120 @@
 import json
 import re
 import datetime
-import feedparser
 from collections import defaultdict
 import os
 import argparse
 import matplotlib.pyplot as plt
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
+import requests
 from dateutil import parser as date_parser
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from lexicon_scorer import LexiconScorer
+from http_fetch import default_fetcher
+from article_cache import default_cache
+from html_extract import extract_article_text, extract_yahoo_news_items
+from seen_store import DEFAULT_TTL, open_seen_store
+from dictionary_store import DictionaryStore
+from bounded_lexicon import BoundedLexicon
+from batch_learner import BatchLearner
+from sentiment_log_store import SentimentLogStore
+from downsample import lttb
+
+SEED_DICTIONARY = {
+    # Positive financial terms
+    "gain": 1.0, "growth": 1.0, "increase": 1.0, "profit": 1.0, "positive": 1.0,
+    "rise": 1.0, "soar": 1.0, "strong": 1.0, "record": 1.0, "surge": 1.0,
+    "boost": 1.0, "improve": 1.0, "outperform": 1.0, "exceed": 1.0, "beat": 1.0,
+    "bullish": 1.0, "upgrade": 1.0, "confident": 1.0, "recovery": 1.0, "opportunity": 1.0,
+    
+    # Negative financial terms
+    "loss": -1.0, "fall": -1.0, "decline": -1.0, "negative": -1.0, "drop": -1.0,
+    "plunge": -1.0, "weaken": -1.0, "concern": -1.0, "delay": -1.0, "down": -1.0,
+    "miss": -1.0, "underperform": -1.0, "fear": -1.0, "crisis": -1.0, "lawsuit": -1.0,
+    "bearish": -1.0, "downgrade": -1.0, "risk": -1.0, "warning": -1.0, "recall": -1.0
+}
+
+
+def _is_transient(error):
+    """Whether a download error is worth retrying: timeouts, dropped connections, 429 and 5xx."""
+    if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
 
 class SentimentAnalyzer:
-    def __init__(self, ticker, keyword=None, learning_rate=0.05, polling_interval=60):
+    def __init__(self, ticker, keyword=None, learning_rate=0.05, polling_interval=60, fetcher=None,
+                 article_cache=None, html_backend=None, seen_ttl=DEFAULT_TTL, seen_bloom_capacity=None,
+                 max_terms=None, eviction_policy='weight', batch_learning=False, log_store=None):
         self.ticker = ticker
         self.keyword = keyword
         self.rss_url = f'https://finance.yahoo.com/rss/headline?s={ticker}'
         self.dictionary_file = f'sentiment_dictionary_{ticker}.json'
         self.log_file = f'sentiment_log_{ticker}.csv'
         self.learning_rate = learning_rate
+        self.batch_learning = batch_learning
+        self.batch_learner = BatchLearner(learning_rate)
         self.polling_interval = polling_interval
         self.positive_threshold = 0.05
         self.negative_threshold = -0.05
-        self.seen_links = set()
+        self.dirty = False
+        self.fetcher = fetcher if fetcher is not None else default_fetcher()
+        self.article_cache = article_cache if article_cache is not None else default_cache()
+        self.html_backend = html_backend
+        self.log_store = log_store
         
         # Create directory for logs
         os.makedirs('logs', exist_ok=True)
         
         # Initialize sentiment dictionary and seen links
+        self.dictionary_store = DictionaryStore(f'logs/{self.dictionary_file}')
+        self.changed_terms = set()
         self.sentiment_dict = self._load_dictionary()
-        self.seen_links_file = f'logs/seen_links_{ticker}.json'
-        self._load_seen_links()
+        if max_terms:
+            # Cap the learned vocabulary; evicted terms are logged as removed on the next save
+            self.sentiment_dict = BoundedLexicon(
+                self.sentiment_dict, capacity=max_terms, policy=eviction_policy,
+                pinned=SEED_DICTIONARY, on_evict=self.changed_terms.add,
+            )
+        self.scorer = LexiconScorer(self.sentiment_dict)
+        # Append-only, expiring store; migrates the old seen_links_{ticker}.json once
+        self.seen_links = open_seen_store(
+            f'logs/seen_links_{ticker}.log',
+            legacy_json=f'logs/seen_links_{ticker}.json',
+            ttl=seen_ttl,
+            bloom_capacity=seen_bloom_capacity,
+        )
+        if len(self.seen_links):
+            print(f"Loaded {len(self.seen_links)} previously seen links")
+        
+        # Move an existing CSV log into the store the first time this ticker uses it
+        if self.log_store is not None:
+            if ticker not in self.log_store.tickers() and os.path.exists(f'logs/{self.log_file}'):
+                imported = self.log_store.import_csv(ticker, f'logs/{self.log_file}')
+                print(f"Imported {imported} rows from logs/{self.log_file} into the sentiment log store")
         
         # Initialize log file with header if it doesn't exist
-        if not os.path.exists(f'logs/{self.log_file}'):
+        elif not os.path.exists(f'logs/{self.log_file}'):
             with open(f'logs/{self.log_file}', 'w') as log:
                 log.write('timestamp,score,num_articles,sentiment,source\n')
     
-    def _load_seen_links(self):
-        try:
-            with open(f'logs/{self.seen_links_file}', 'r') as f:
-                self.seen_links = set(json.load(f))
-                print(f"Loaded {len(self.seen_links)} previously seen links")
-        except FileNotFoundError:
-            self.seen_links = set()
-            
     def _save_seen_links(self):
-        with open(f'logs/{self.seen_links_file}', 'w') as f:
-            json.dump(list(self.seen_links), f)
+        self.seen_links.flush()
     
     def _load_dictionary(self):
-        try:
-            with open(f'logs/{self.dictionary_file}', 'r') as f:
-                sentiment_dict = json.load(f)
-                sentiment_dict = {k: float(v) for k, v in sentiment_dict.items()}
-                print(f"Loaded dictionary with {len(sentiment_dict)} terms")
-                return sentiment_dict
-        except FileNotFoundError:
+        sentiment_dict = self.dictionary_store.load()
+        if sentiment_dict is not None:
+            print(f"Loaded dictionary with {len(sentiment_dict)} terms")
+            return sentiment_dict
+        else:
             print("Creating new sentiment dictionary")
-            return {
-                # Positive financial terms
-                "gain": 1.0, "growth": 1.0, "increase": 1.0, "profit": 1.0, "positive": 1.0,
-                "rise": 1.0, "soar": 1.0, "strong": 1.0, "record": 1.0, "surge": 1.0,
-                "boost": 1.0, "improve": 1.0, "outperform": 1.0, "exceed": 1.0, "beat": 1.0,
-                "bullish": 1.0, "upgrade": 1.0, "confident": 1.0, "recovery": 1.0, "opportunity": 1.0,
-                
-                # Negative financial terms
-                "loss": -1.0, "fall": -1.0, "decline": -1.0, "negative": -1.0, "drop": -1.0,
-                "plunge": -1.0, "weaken": -1.0, "concern": -1.0, "delay": -1.0, "down": -1.0,
-                "miss": -1.0, "underperform": -1.0, "fear": -1.0, "crisis": -1.0, "lawsuit": -1.0,
-                "bearish": -1.0, "downgrade": -1.0, "risk": -1.0, "warning": -1.0, "recall": -1.0
-            }
+            return dict(SEED_DICTIONARY)
     
     def score_with_dictionary(self, text):
         # Normalize text, handle negations
@@ -105,6 +148,10 @@ class SentimentAnalyzer:
 
         return score
     
+    def score_batch(self, texts):
+        """Score many texts at once; same values as score_with_dictionary, without the logging."""
+        return self.scorer.score_batch(texts)
+    
     def update_dictionary(self, text, sentiment_score):
         # Don't update for neutral content
         if abs(sentiment_score) < 0.01:
@@ -113,30 +160,55 @@ class SentimentAnalyzer:
         # Extract unique words
         words = set(re.findall(r'\b\w+\b', text.lower()))
         
-        # Update dictionary
+        # Update dictionary (peek so learning does not count as a match for the eviction policy)
+        current = getattr(self.sentiment_dict, 'peek', self.sentiment_dict.get)
         for word in words:
             if len(word) >= 3:  # Ignore very short words
-                self.sentiment_dict[word] = self.sentiment_dict.get(word, 0) + self.learning_rate * sentiment_score
+                self.sentiment_dict[word] = current(word, 0) + self.learning_rate * sentiment_score
+                self.changed_terms.add(word)
+    
+    def update_dictionary_batch(self, texts, sentiment_scores):
+        """update_dictionary for a whole poll or backfill day as one sparse matrix product."""
+        self.changed_terms.update(self.batch_learner.apply(self.sentiment_dict, list(texts), sentiment_scores))
     
     def save_dictionary(self):
-        with open(f'logs/{self.dictionary_file}', 'w') as f:
-            json.dump(self.sentiment_dict, f)
+        """Append the terms changed since the last save to the delta log (compacting when it grows)."""
+        self.dictionary_store.save(self.sentiment_dict, self.changed_terms)
+        self.changed_terms.clear()
             
     def log_sentiment(self, timestamp, score, num_articles, source='live'):
         sentiment = "positive" if score >= self.positive_threshold else "negative" if score <= self.negative_threshold else "neutral"
+        if self.log_store is not None:
+            # Buffered; written with the other state in flush()
+            self.log_store.append(self.ticker, timestamp, round(score, 4), num_articles, sentiment, source)
+            return
         with open(f'logs/{self.log_file}', 'a') as log:
             log.write(f'{timestamp},{score:.4f},{num_articles},{sentiment},{source}\n')
     
-    def analyze_sentiment(self):
+    def analyze_sentiment(self, save=True, raise_errors=False):
+        """Poll the RSS feed once. Returns the number of new articles scored.
+
+        With save=False the dictionary and seen links are only marked dirty;
+        the caller is responsible for calling flush() later. With
+        raise_errors=True a failed poll raises instead of being printed, so
+        the caller can count it.
+        """
+        num_articles = 0
         try:
-            feed = feedparser.parse(self.rss_url)
+            feed = self.fetcher.fetch_feed(self.rss_url)
+            if feed is None:
+                print(f'\nFeed for {self.ticker} unchanged since last poll (304)')
+                return 0
             
             if hasattr(feed, 'bozo_exception'):
+                if raise_errors:
+                    raise feed.bozo_exception
                 print(f"Error parsing feed: {feed.bozo_exception}")
-                return
+                return 0
                 
             total_score = 0
             num_articles = 0
+            learn_batch = []
             
             print(f'\nChecking news for {self.ticker} (filter: "{self.keyword}")...')
             print(f'Found {len(feed.entries)} articles in feed')
@@ -165,12 +237,18 @@ class SentimentAnalyzer:
                 label = "Positive" if score > self.positive_threshold else "Negative" if score < self.negative_threshold else "Neutral"
                 print(f'Sentiment: {label}, Raw Score: {score:.4f}')
                 
-                # Update sentiment dictionary
-                self.update_dictionary(entry.title + " " + entry.summary, score)
+                # Update sentiment dictionary (batched: after the whole poll is scored)
+                if self.batch_learning:
+                    learn_batch.append((entry.title + " " + entry.summary, score))
+                else:
+                    self.update_dictionary(entry.title + " " + entry.summary, score)
                 
                 total_score += score
                 num_articles += 1
             
+            if learn_batch:
+                self.update_dictionary_batch(*zip(*learn_batch))
+            
             # Calculate overall sentiment
             if num_articles > 0:
                 final_score = total_score / num_articles
@@ -179,45 +257,104 @@ class SentimentAnalyzer:
                 
                 timestamp = datetime.datetime.now().isoformat()
                 self.log_sentiment(timestamp, final_score, num_articles, 'live')
-                self.save_dictionary()
-                self._save_seen_links()
+                self.dirty = True
+                if save:
+                    self.flush()
                 
                 # Show top terms
                 top_terms = sorted(self.sentiment_dict.items(), key=lambda x: abs(x[1]), reverse=True)[:10]
                 print("\nTop sentiment terms in dictionary:")
                 for term, value in top_terms:
                     print(f"  {term}: {value:.4f}")
+                if isinstance(self.sentiment_dict, BoundedLexicon):
+                    print(f"Lexicon: {self.sentiment_dict.stats()}")
             else:
                 print("No new relevant articles found.")
                 
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error analyzing sentiment: {e}")
+        return num_articles
+    
+    def flush(self):
+        """Persist the dictionary, seen links and buffered log rows if anything changed since the last flush."""
+        if self.dirty:
+            self.save_dictionary()
+            self._save_seen_links()
+            if self.log_store is not None:
+                self.log_store.flush()
+            self.dirty = False
+    
+    def _download_article_text(self, url):
+        cached = self.article_cache.get(url, kind='page_text')
+        if cached is not None:
+            return cached
+        
+        response = self.fetcher.get(url, timeout=10)
+        response.raise_for_status()
+        
+        # Visible text without script/style, whitespace collapsed (fastest installed parser)
+        text = extract_article_text(response.text, backend=self.html_backend)
+        
+        if text:
+            self.article_cache.put(url, text, kind='page_text')
+        return text
     
     def fetch_article_content(self, url):
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-                
-            # Get text content
-            text = soup.get_text(separator=' ', strip=True)
-            
-            # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text).strip()
-            
-            return text
+            return self._download_article_text(url)
         except Exception as e:
             print(f"Error fetching article content: {e}")
             return ""
     
+    def prefetch_article_contents(self, links, max_workers=8, per_host=4, retry_budget=None):
+        """Fetch many article bodies concurrently. Returns {link: text}, '' for failures.
+        
+        At most `max_workers` downloads run at once and at most `per_host` of
+        them against any single host. Transient failures (timeouts, connection
+        errors, HTTP 429 and 5xx) are retried with backoff while the shared
+        `retry_budget` (default: one retry per link) lasts; anything else, such
+        as a 404 or a parse error, fails at once without spending it.
+        """
+        links = list(dict.fromkeys(links))
+        if retry_budget is None:
+            retry_budget = len(links)
+        
+        host_slots = defaultdict(lambda: threading.BoundedSemaphore(per_host))
+        slots_lock = threading.Lock()
+        budget = {'retries': retry_budget}
+        budget_lock = threading.Lock()
+        
+        def take_retry():
+            with budget_lock:
+                if budget['retries'] <= 0:
+                    return False
+                budget['retries'] -= 1
+                return True
+        
+        def fetch(link):
+            with slots_lock:
+                slot = host_slots[urlsplit(link).netloc]
+            attempt = 0
+            while True:
+                try:
+                    with slot:
+                        return self._download_article_text(link)
+                except Exception as e:
+                    if not _is_transient(e) or not take_retry():
+                        print(f"Error fetching article content: {e}")
+                        return ""
+                    attempt += 1
+                    time.sleep(min(0.5 * 2 ** (attempt - 1), 8))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            contents = dict(zip(links, pool.map(fetch, links)))
+        
+        fetched = sum(1 for text in contents.values() if text)
+        print(f"Prefetched {fetched}/{len(links)} articles ({retry_budget - budget['retries']} retries used)")
+        return contents
+    
     def fetch_historical_news(self, days=30, max_articles=100):
         articles = []
         
@@ -228,37 +365,23 @@ class SentimentAnalyzer:
             print(f"Fetching historical news from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
             
             url = f"https://finance.yahoo.com/quote/{self.ticker}/news"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = self.fetcher.get(url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            news_items = soup.find_all('div', {'class': 'Ov(h)'})
+            news_items = extract_yahoo_news_items(response.text, backend=self.html_backend)
             
             for item in news_items[:max_articles]:
                 try:
-                    title_elem = item.find('h3')
-                    if not title_elem:
-                        continue
-                        
-                    title = title_elem.text.strip()
+                    title = item['title']
                     
-                    link_elem = item.find('a')
-                    if not link_elem or not link_elem.has_attr('href'):
-                        continue
-                        
-                    link = link_elem['href']
+                    link = item['href']
                     if not link.startswith('http'):
                         link = f"https://finance.yahoo.com{link}"
                         
-                    summary_elem = item.find('p')
-                    summary = summary_elem.text.strip() if summary_elem else title
+                    summary = item['summary'] if item['summary'] is not None else title
                     
-                    date_elem = item.find('span', {'class': 'C($tertiaryColor)'})
-                    date_str = date_elem.text.strip() if date_elem else None
+                    date_str = item['date_str']
                     
                     # Parse date
                     article_date = datetime.datetime.now()
@@ -305,7 +428,8 @@ class SentimentAnalyzer:
             
         return articles
     
-    def analyze_historical_data(self, days=30, max_articles=100, fetch_full_content=False, mode='analyze'):
+    def analyze_historical_data(self, days=30, max_articles=100, fetch_full_content=False, mode='analyze',
+                                fetch_workers=8):
         articles = self.fetch_historical_news(days, max_articles)
         
         if not articles:
@@ -314,6 +438,12 @@ class SentimentAnalyzer:
             
         print(f"Found {len(articles)} historical articles")
         
+        # Download every article body up front; scoring below stays sequential and in day order
+        contents = {}
+        if fetch_full_content:
+            print("Fetching full content...")
+            contents = self.prefetch_article_contents([a['link'] for a in articles], max_workers=fetch_workers)
+        
         # Group articles by date
         date_grouped = defaultdict(list)
         for article in articles:
@@ -324,6 +454,7 @@ class SentimentAnalyzer:
         for date_str, day_articles in sorted(date_grouped.items()):
             total_score = 0
             num_articles = 0
+            learn_batch = []
             
             print(f"\nProcessing news from {date_str} ({len(day_articles)} articles)")
             
@@ -333,10 +464,7 @@ class SentimentAnalyzer:
                 print(f'Published: {article["date"]}')
                 print(f'Summary: {article["summary"]}')
                 
-                content = ""
-                if fetch_full_content:
-                    print("Fetching full content...")
-                    content = self.fetch_article_content(article['link'])
+                content = contents.get(article['link'], "")
                     
                 # Mark as seen
                 self.seen_links.add(article['link'])
@@ -359,11 +487,17 @@ class SentimentAnalyzer:
                     combined_text = article['title'] + " " + article['summary']
                     if content:
                         combined_text += " " + content
-                    self.update_dictionary(combined_text, score)
+                    if self.batch_learning:
+                        learn_batch.append((combined_text, score))
+                    else:
+                        self.update_dictionary(combined_text, score)
                 
                 total_score += score
                 num_articles += 1
             
+            if learn_batch:
+                self.update_dictionary_batch(*zip(*learn_batch))
+            
             # Calculate and log daily sentiment
             if num_articles > 0:
                 final_score = total_score / num_articles
@@ -380,12 +514,49 @@ class SentimentAnalyzer:
             self.save_dictionary()
             
         self._save_seen_links()
+        if self.log_store is not None:
+            self.log_store.flush()
         print("\nHistorical analysis complete")
     
-    def plot_historical_sentiment(self):
+    def _log_fingerprint(self):
+        """Token that changes whenever rows are added to this ticker's sentiment log."""
+        if self.log_store is not None:
+            return self.log_store.fingerprint(self.ticker)
         try:
+            stat = os.stat(f'logs/{self.log_file}')
+        except FileNotFoundError:
+            return None
+        return f'{stat.st_size}:{stat.st_mtime_ns}'
+    
+    def plot_historical_sentiment(self, window=None, max_points=2000, force=False):
+        """Plot the sentiment log to logs/sentiment_plot_{ticker}[_{window}].png.
+
+        `window` (e.g. '7d', '12h') limits the plot to that span before now.
+        Longer series are downsampled to `max_points` with LTTB, which keeps
+        spikes visible, and the image is only re-rendered when rows were
+        logged since it was last drawn (or with force=True). A windowed plot is
+        also redrawn once the hour rolls over, since its time range moved.
+        """
+        suffix = f'_{window}' if window else ''
+        plot_file = f'logs/sentiment_plot_{self.ticker}{suffix}.png'
+        key_file = f'{plot_file}.key'
+        try:
+            # The window slides with the clock even when no rows arrive
+            window_end = str(pd.Timestamp.now().floor('h')) if window else None
+            render_key = json.dumps([self._log_fingerprint(), window, window_end, max_points,
+                                     self.positive_threshold, self.negative_threshold])
+            if not force and os.path.exists(plot_file) and os.path.exists(key_file):
+                with open(key_file, 'r') as f:
+                    if f.read() == render_key:
+                        print(f"Plot up to date: {plot_file}")
+                        return plot_file
+            
             # Load the sentiment log
-            data = pd.read_csv(f'logs/{self.log_file}')
+            start = pd.Timestamp.now() - pd.Timedelta(window) if window else None
+            if self.log_store is not None:
+                data = self.log_store.read(self.ticker, start=start)
+            else:
+                data = pd.read_csv(f'logs/{self.log_file}')
             
             if len(data) == 0:
                 print("No data to plot yet.")
@@ -393,6 +564,19 @@ class SentimentAnalyzer:
                 
             # Convert timestamp to datetime
             data['timestamp'] = pd.to_datetime(data['timestamp'])
+            # The CSV log is in append order, which is not always time order; LTTB needs sorted x
+            data = data.sort_values('timestamp', kind='stable')
+            if start is not None:
+                data = data[data['timestamp'] >= start]
+                if len(data) == 0:
+                    print(f"No data in the last {window}.")
+                    return
+            
+            # Shape-preserving downsample so months of minute-level polls stay readable and fast to draw
+            num_rows = len(data)
+            if num_rows > max_points:
+                keep = lttb(data['timestamp'].astype('int64').to_numpy(), data['score'].to_numpy(), max_points)
+                data = data.iloc[keep]
             
             # Create plot
             plt.figure(figsize=(12, 8))
@@ -407,17 +591,25 @@ class SentimentAnalyzer:
             plt.fill_between(data['timestamp'], data['score'], 0, where=(data['score'] <= 0), 
                            color='red', alpha=0.3, interpolate=True)
             
-            plt.title(f'Sentiment Analysis for {self.ticker}')
+            title = f'Sentiment Analysis for {self.ticker}'
+            if window:
+                title += f' (last {window})'
+            if num_rows > len(data):
+                title += f' - {len(data)} of {num_rows} points'
+            plt.title(title)
             plt.ylabel('Sentiment Score')
             plt.xlabel('Time')
             plt.legend()
             plt.grid(True, alpha=0.3)
             plt.tight_layout()
             
-            plt.savefig(f'logs/sentiment_plot_{self.ticker}.png')
+            plt.savefig(plot_file)
             plt.close()
+            with open(key_file, 'w') as f:
+                f.write(render_key)
             
-            print(f"Plot saved to logs/sentiment_plot_{self.ticker}.png")
+            print(f"Plot saved to {plot_file}")
+            return plot_file
             
         except Exception as e:
             print(f"Error plotting data: {e}")
@@ -437,6 +629,8 @@ class SentimentAnalyzer:
             print("\nStopped by user. Saving data...")
             self.save_dictionary()
             self._save_seen_links()
+            if self.log_store is not None:
+                self.log_store.flush()
             print("Data saved.")
 
 if __name__ == "__main__":
@@ -447,11 +641,24 @@ if __name__ == "__main__":
     parser.add_argument('--learning-rate', type=float, default=0.05, help='Learning rate for dictionary updates')
     parser.add_argument('--interval', type=int, default=60, help='Polling interval in seconds')
     parser.add_argument('--plot', action='store_true', help='Plot historical sentiment data and exit')
+    parser.add_argument('--window', type=str, default=None, help="Only plot this recent span, e.g. '7d' or '12h'")
+    parser.add_argument('--max-points', type=int, default=2000, help='Downsample the plot to at most this many points')
     parser.add_argument('--historical', action='store_true', help='Analyze historical data')
     parser.add_argument('--days', type=int, default=30, help='Number of days to look back for historical analysis')
     parser.add_argument('--max-articles', type=int, default=100, help='Maximum articles to process for historical analysis')
     parser.add_argument('--full-content', action='store_true', help='Fetch full article content for historical analysis')
     parser.add_argument('--learning-mode', action='store_true', help='Update dictionary while processing historical data')
+    parser.add_argument('--fetch-workers', type=int, default=8, help='Concurrent downloads for --full-content')
+    parser.add_argument('--seen-ttl-days', type=float, default=DEFAULT_TTL / 86400, help='Forget seen links after this many days')
+    parser.add_argument('--seen-bloom-capacity', type=int, default=None,
+                        help='Track seen links in a fixed-size Bloom filter sized for this many links')
+    parser.add_argument('--max-terms', type=int, default=None, help='Cap the learned dictionary at this many terms')
+    parser.add_argument('--eviction', choices=['weight', 'lru', 'lfu'], default='weight',
+                        help='Which terms --max-terms evicts first: lowest |weight|, least recently or least often matched')
+    parser.add_argument('--batch-learning', action='store_true',
+                        help='Update the dictionary once per poll / backfill day instead of once per article')
+    parser.add_argument('--parquet-log', action='store_true',
+                        help='Log to the partitioned Parquet store in logs/sentiment_store instead of the CSV (needs pyarrow)')
     
     args = parser.parse_args()
     
@@ -460,7 +667,13 @@ if __name__ == "__main__":
         ticker=args.ticker, 
         keyword=args.keyword,
         learning_rate=args.learning_rate,
-        polling_interval=args.interval
+        polling_interval=args.interval,
+        seen_ttl=args.seen_ttl_days * 86400,
+        seen_bloom_capacity=args.seen_bloom_capacity,
+        max_terms=args.max_terms,
+        eviction_policy=args.eviction,
+        batch_learning=args.batch_learning,
+        log_store=SentimentLogStore() if args.parquet_log else None
     )
     
     # Determine what to do based on arguments
@@ -471,9 +684,10 @@ if __name__ == "__main__":
             days=args.days,
             max_articles=args.max_articles,
             fetch_full_content=args.full_content,
-            mode=mode
+            mode=mode,
+            fetch_workers=args.fetch_workers
         )
     elif args.plot:
-        analyzer.plot_historical_sentiment()
+        analyzer.plot_historical_sentiment(window=args.window, max_points=args.max_points)
     else:
         analyzer.run()
\ No newline at end of file
@@ -0,0 +1,219 @@
+import argparse
+import heapq
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+
+import numpy as np
+
+from http_fetch import Fetcher
+from main import SentimentAnalyzer
+from seen_store import DEFAULT_TTL
+from sentiment_log_store import SentimentLogStore
+
+
+@dataclass
+class TickerStats:
+    polls: int = 0
+    errors: int = 0
+    articles: int = 0
+    last_lag: float = 0.0        # seconds between the scheduled and the actual poll start
+    max_lag: float = 0.0
+    last_duration: float = 0.0   # seconds spent fetching and scoring in the last poll
+    last_finished: float = None  # time.time() of the last completed poll
+
+
+class MultiTickerMonitor:
+    """Drive many SentimentAnalyzer instances from one process.
+
+    Polls are staggered evenly across `polling_interval`, at most
+    `max_concurrent_fetches` run at once on a shared thread pool, and the
+    dictionary / seen-links writes of every analyzer are batched into one
+    flush every `flush_interval` seconds instead of one per productive poll.
+    All analyzers share one Fetcher, i.e. one connection pool and one
+    per-host rate limit. Extra keyword arguments go to every analyzer
+    (e.g. seen_bloom_capacity to bound seen-link memory per ticker).
+    """
+
+    def __init__(self, tickers, keyword=None, learning_rate=0.05, polling_interval=60,
+                 max_concurrent_fetches=16, flush_interval=300, min_host_interval=0.0,
+                 analyzer_factory=SentimentAnalyzer, fetcher=None, **analyzer_kwargs):
+        self.polling_interval = polling_interval
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self.flush_interval = flush_interval
+        self.fetcher = fetcher if fetcher is not None else Fetcher(
+            pool_maxsize=max_concurrent_fetches, min_host_interval=min_host_interval)
+        self.analyzers = {
+            ticker: analyzer_factory(ticker, keyword=keyword, learning_rate=learning_rate,
+                                     polling_interval=polling_interval, fetcher=self.fetcher, **analyzer_kwargs)
+            for ticker in dict.fromkeys(tickers)
+        }
+        self.stats = {ticker: TickerStats() for ticker in self.analyzers}
+        self._running = {}
+        self._queue = []
+        self._last_flush = time.monotonic()
+
+    def _schedule_initial(self, now):
+        step = self.polling_interval / max(len(self.analyzers), 1)
+        self._queue = [(now + i * step, i, ticker) for i, ticker in enumerate(self.analyzers)]
+        heapq.heapify(self._queue)
+
+    def _poll(self, ticker):
+        analyzer = self.analyzers[ticker]
+        start = time.monotonic()
+        # Failures propagate to _collect, which counts them in TickerStats.errors
+        articles = analyzer.analyze_sentiment(save=False, raise_errors=True)
+        return articles, time.monotonic() - start
+
+    def _submit_due(self, pool, now):
+        while self._queue and self._queue[0][0] <= now and len(self._running) < self.max_concurrent_fetches:
+            due, seq, ticker = heapq.heappop(self._queue)
+            stats = self.stats[ticker]
+            stats.last_lag = now - due
+            stats.max_lag = max(stats.max_lag, stats.last_lag)
+            self._running[pool.submit(self._poll, ticker)] = (ticker, due, seq)
+
+    def _collect(self, done):
+        for future in done:
+            ticker, due, seq = self._running.pop(future)
+            stats = self.stats[ticker]
+            stats.polls += 1
+            try:
+                articles, duration = future.result()
+                stats.articles += articles
+                stats.last_duration = duration
+            except Exception as e:
+                stats.errors += 1
+                print(f"Error polling {ticker}: {e}")
+            stats.last_finished = time.time()
+            # Keep the staggered slot; if we fell behind, poll again as soon as possible
+            heapq.heappush(self._queue, (max(due + self.polling_interval, time.monotonic()), seq, ticker))
+
+    def flush(self, force=False):
+        """Persist every idle analyzer with unsaved changes."""
+        busy = {ticker for ticker, _, _ in self._running.values()}
+        flushed = 0
+        for ticker, analyzer in self.analyzers.items():
+            if ticker in busy and not force:
+                continue
+            if analyzer.dirty:
+                try:
+                    analyzer.flush()
+                    flushed += 1
+                except Exception as e:
+                    print(f"Error saving data for {ticker}: {e}")
+        self._last_flush = time.monotonic()
+        return flushed
+
+    def metrics(self):
+        """Per-ticker lag metrics plus a fleet-wide summary."""
+        now = time.time()
+        per_ticker = {
+            ticker: {
+                "polls": s.polls,
+                "errors": s.errors,
+                "articles": s.articles,
+                "lag": s.last_lag,
+                "max_lag": s.max_lag,
+                "poll_seconds": s.last_duration,
+                "staleness": now - s.last_finished if s.last_finished else None,
+            }
+            for ticker, s in self.stats.items()
+        }
+        lags = np.array([s.last_lag for s in self.stats.values() if s.polls], dtype=np.float64)
+        summary = {
+            "tickers": len(self.analyzers),
+            "in_flight": len(self._running),
+            "lag_p50": float(np.percentile(lags, 50)) if len(lags) else 0.0,
+            "lag_p95": float(np.percentile(lags, 95)) if len(lags) else 0.0,
+            "lag_max": float(lags.max()) if len(lags) else 0.0,
+        }
+        summary.update(self.fetcher.stats())
+        return per_ticker, summary
+
+    def run(self, duration=None, report_interval=None):
+        """Poll until interrupted (or for `duration` seconds), then flush everything."""
+        start = time.monotonic()
+        self._schedule_initial(start)
+        report_interval = report_interval or self.flush_interval
+
+        print(f"Monitoring {len(self.analyzers)} tickers every {self.polling_interval}s "
+              f"with at most {self.max_concurrent_fetches} concurrent fetches")
+        print("Press Ctrl+C to stop")
+
+        last_report = start
+        pool = ThreadPoolExecutor(max_workers=self.max_concurrent_fetches, thread_name_prefix="poll")
+        try:
+            while duration is None or time.monotonic() - start < duration:
+                now = time.monotonic()
+                self._submit_due(pool, now)
+
+                next_due = self._queue[0][0] if self._queue else now + self.polling_interval
+                if len(self._running) >= self.max_concurrent_fetches:
+                    next_due = float("inf")  # nothing can start until a poll finishes
+                timeout = max(0.0, min(next_due, self._last_flush + self.flush_interval) - now)
+                if self._running:
+                    done, _ = wait(list(self._running), timeout=timeout, return_when=FIRST_COMPLETED)
+                    self._collect(done)
+                else:
+                    time.sleep(timeout)
+
+                now = time.monotonic()
+                if now - self._last_flush >= self.flush_interval:
+                    self.flush()
+                if now - last_report >= report_interval:
+                    _, summary = self.metrics()
+                    print(f"\n>> Monitor: {summary['in_flight']} in flight, lag p50 {summary['lag_p50']:.2f}s, "
+                          f"p95 {summary['lag_p95']:.2f}s, max {summary['lag_max']:.2f}s, "
+                          f"{summary['parses_skipped']} unchanged feeds skipped, "
+                          f"{summary['bytes_transferred'] / 1e6:.1f} MB transferred")
+                    last_report = now
+        except KeyboardInterrupt:
+            print("\nStopped by user. Saving data...")
+        finally:
+            pool.shutdown(wait=True)
+            self._collect(list(self._running))
+            self.flush(force=True)
+            print("Data saved.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Real-time news sentiment for many tickers in one process')
+    parser.add_argument('--tickers', type=str, default='BA', help='Comma-separated ticker symbols')
+    parser.add_argument('--tickers-file', type=str, default=None, help='File with one ticker per line')
+    parser.add_argument('--keyword', type=str, default=None, help='Keyword filter (optional)')
+    parser.add_argument('--learning-rate', type=float, default=0.05, help='Learning rate for dictionary updates')
+    parser.add_argument('--interval', type=int, default=60, help='Polling interval per ticker in seconds')
+    parser.add_argument('--max-fetches', type=int, default=16, help='Maximum concurrent feed fetches')
+    parser.add_argument('--flush-interval', type=int, default=300, help='Seconds between batched saves')
+    parser.add_argument('--min-host-interval', type=float, default=0.0, help='Minimum seconds between requests to one host')
+    parser.add_argument('--seen-ttl-days', type=float, default=DEFAULT_TTL / 86400, help='Forget seen links after this many days')
+    parser.add_argument('--seen-bloom-capacity', type=int, default=None,
+                        help='Track seen links per ticker in a fixed-size Bloom filter sized for this many links')
+    parser.add_argument('--max-terms', type=int, default=None, help='Cap each learned dictionary at this many terms')
+    parser.add_argument('--parquet-log', action='store_true',
+                        help='Log every ticker to one partitioned Parquet store in logs/sentiment_store (needs pyarrow)')
+    parser.add_argument('--eviction', choices=['weight', 'lru', 'lfu'], default='weight',
+                        help='Which terms --max-terms evicts first: lowest |weight|, least recently or least often matched')
+    args = parser.parse_args()
+
+    tickers = [t.strip().upper() for t in args.tickers.split(',') if t.strip()]
+    if args.tickers_file:
+        with open(args.tickers_file, 'r') as f:
+            tickers += [line.strip().upper() for line in f if line.strip()]
+
+    monitor = MultiTickerMonitor(
+        tickers,
+        keyword=args.keyword,
+        learning_rate=args.learning_rate,
+        polling_interval=args.interval,
+        max_concurrent_fetches=args.max_fetches,
+        flush_interval=args.flush_interval,
+        min_host_interval=args.min_host_interval,
+        seen_ttl=args.seen_ttl_days * 86400,
+        seen_bloom_capacity=args.seen_bloom_capacity,
+        max_terms=args.max_terms,
+        eviction_policy=args.eviction,
+        log_store=SentimentLogStore() if args.parquet_log else None,
+    )
+    monitor.run()
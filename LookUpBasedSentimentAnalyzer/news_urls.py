@@ -0,0 +1,43 @@
+import pandas as pd
+
+from article_cache import default_cache, normalize_url
+
+# Sample Yahoo Finance articles shared by the dictionary, FinBERT and LLM scorers
+URLS = [
+    "https://finance.yahoo.com/news/summer-travel-season-heats-up-with-lower-gas-prices-and-airfares-150006735.html",
+    "https://finance.yahoo.com/news/walmart-should-eat-the-tariffs-trump-says-after-retailer-warns-of-looming-price-hikes-155126753.html",
+    "https://finance.yahoo.com/news/jd-power-car-buyers-are-still-interested-in-evs-and-tesla-alternatives-144540737.html",
+    "https://finance.yahoo.com/news/germany-does-not-expect-unicredit-191434131.html",
+    "https://finance.yahoo.com/news/trump-speak-putin-zelenskyy-fresh-162953991.html"
+]
+
+
+def load_articles(urls=URLS, cache=None):
+    """Return a title/text DataFrame for `urls`, downloading only those missing from the article cache."""
+    cache = cache if cache is not None else default_cache()
+    articles = {url: cache.get(url, kind="newspaper") for url in urls}
+
+    missing = [url for url, article in articles.items() if article is None]
+    if missing:
+        from langchain_community.document_loaders import NewsURLLoader
+
+        requested = {normalize_url(url): url for url in missing}
+        docs = NewsURLLoader(urls=missing).load()
+        # The loader returns one document per URL in request order unless some failed
+        by_position = len(docs) == len(missing)
+        for i, d in enumerate(docs):
+            link = d.metadata.get("link", "")
+            url = requested.get(normalize_url(link))
+            if url is None and by_position:
+                # Redirected, canonical or AMP link: fall back to the request at the same position
+                url = missing[i]
+            if url is None:
+                print(f"Could not match downloaded article {link!r} to a requested URL; not cached")
+                continue
+            article = {"title": d.metadata["title"], "text": d.page_content}
+            cache.put(url, article, kind="newspaper")
+            articles[url] = article
+
+    return pd.DataFrame(
+        [{"title": a["title"], "text": a["text"]} for a in articles.values() if a is not None]
+    )
@@ -0,0 +1,123 @@
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Same markers as llm_scorer.PROMPT_TEMPLATE (not imported: the stub runs without langchain)
+NEWS_START = "<news>"
+NEWS_END = "</news>"
+
+POSITIVE_WORDS = {"gain", "growth", "profit", "beat", "surge", "rise", "strong", "upgrade", "record"}
+NEGATIVE_WORDS = {"loss", "decline", "drop", "miss", "lawsuit", "downgrade", "fall", "warning", "recall"}
+
+
+def news_text(prompt):
+    """The news part of a prompt: from the first NEWS_START to the last NEWS_END, whatever the text contains."""
+    start = prompt.find(NEWS_START)
+    end = prompt.rfind(NEWS_END)
+    if start < 0 or end < start:
+        return prompt
+    return prompt[start + len(NEWS_START):end]
+
+
+def classify(text):
+    # Deterministic keyword vote so results are stable across runs
+    words = [w.strip(".,!?\"'()").lower() for w in text.split()]
+    balance = sum(w in POSITIVE_WORDS for w in words) - sum(w in NEGATIVE_WORDS for w in words)
+    sentiment = "positive" if balance > 0 else "negative" if balance < 0 else "neutral"
+    return {
+        "sentiment": sentiment,
+        "score": max(-1.0, min(1.0, balance / 5)),
+        "justification": "stub keyword vote",
+        "main_entity": "stub",
+    }
+
+
+class OllamaStubHandler(BaseHTTPRequestHandler):
+    """Answers /api/chat and /api/generate like a local Ollama server."""
+
+    server_version = "OllamaStub/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json_lines(self, payloads):
+        body = "".join(json.dumps(p) + "\n" for p in payloads).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._send_json_lines([{"models": [{"name": self.server.model, "model": self.server.model}]}])
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        with self.server.lock:
+            self.server.requests += 1
+            fail_now = self.server.requests <= self.server.fail_first
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if fail_now or (self.server.fail_rate and random.random() < self.server.fail_rate):
+            self.send_error(503, "stub failure")
+            return
+
+        if self.path == "/api/chat":
+            text = "\n".join(m.get("content", "") for m in request.get("messages", []))
+        elif self.path == "/api/generate":
+            text = request.get("prompt", "")
+        else:
+            self.send_error(404)
+            return
+
+        # Only the news text matters for the vote, not the format instructions
+        content = json.dumps(classify(news_text(text)))
+        payload = {
+            "model": request.get("model", self.server.model),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "done": True,
+            "done_reason": "stop",
+        }
+        if self.path == "/api/chat":
+            payload["message"] = {"role": "assistant", "content": content}
+        else:
+            payload["response"] = content
+        self._send_json_lines([payload])
+
+
+def serve(host="127.0.0.1", port=11434, model="llama2", delay=0.0, fail_rate=0.0, fail_first=0):
+    server = ThreadingHTTPServer((host, port), OllamaStubHandler)
+    server.model = model
+    server.delay = delay
+    server.fail_rate = fail_rate
+    server.fail_first = fail_first
+    server.requests = 0
+    server.lock = threading.Lock()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for an Ollama server, for exercising LLMScorer")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--model", default="llama2")
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before each answer")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 503")
+    parser.add_argument("--fail-first", type=int, default=0, help="Answer the first N requests with HTTP 503")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.model, args.delay, args.fail_rate, args.fail_first)
+    print(f"Ollama stub listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCORE_CACHE_PATH = os.path.join(script_dir, "score_cache.sqlite")
+
+SQLITE_MAX_PARAMS = 900
+
+
+def normalize_text(text):
+    """Unicode NFC with whitespace runs collapsed; texts equal after this score the same."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(scorer, version, text):
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{scorer}\0{version}\0{digest}"
+
+
+class ScoreCache:
+    """Memo of per-text scores keyed by (scorer, scorer version, normalized text hash).
+
+    The memory tier is an LRU of at most `max_items` entries. With `path` set,
+    a SQLite file backs it, so scores survive restarts and are shared by every
+    script and process pointing at the same file. Stored scores older than
+    `ttl` seconds count as missing, and once the file holds more than
+    `max_rows` scores the least recently read ones are evicted. Values must be
+    JSON serializable (a float, a list of probabilities, ...).
+
+    Bump `version` whenever a scorer's output can change (new model, new
+    lexicon, new prompt); old entries are then simply never hit again.
+    """
+
+    def __init__(self, path=None, max_items=100_000, ttl=30 * 24 * 3600, max_rows=1_000_000):
+        self.path = path
+        self.max_items = max_items
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {"memory_hits": 0, "disk_hits": 0, "misses": 0})
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, created_at REAL, accessed_at REAL, value TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS scores_accessed ON scores (accessed_at)")
+            # Drops expired scores and counts the rest
+            self._evict()
+            self._conn.commit()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, keys):
+        found = {}
+        now = time.time()
+        oldest = now - self.ttl if self.ttl else float("-inf")
+        for i in range(0, len(keys), SQLITE_MAX_PARAMS):
+            chunk = keys[i:i + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT key, value FROM scores WHERE key IN ({placeholders}) AND created_at >= ?"
+            for key, value in self._conn.execute(query, chunk + [oldest]):
+                found[key] = json.loads(value)
+        if found:
+            self._conn.executemany("UPDATE scores SET accessed_at = ? WHERE key = ?", [(now, key) for key in found])
+            self._conn.commit()
+        return found
+
+    def _evict(self):
+        # _rows is an upper bound between calls (replaced keys count twice), recounted here
+        if self.ttl:
+            self._conn.execute("DELETE FROM scores WHERE created_at < ?", (time.time() - self.ttl,))
+        self._rows = self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+        if self._rows <= self.max_rows:
+            return
+        # Trim to 90% so we do not evict on every subsequent write
+        excess = self._rows - int(self.max_rows * 0.9)
+        self._conn.execute(
+            "DELETE FROM scores WHERE key IN (SELECT key FROM scores ORDER BY accessed_at LIMIT ?)", (excess,)
+        )
+        self._rows -= excess
+
+    def get_many(self, scorer, version, texts):
+        """Cached values for `texts` (None where missing).
+
+        Texts that normalize to the same string are one lookup in the stats,
+        matching memoize(), which computes them once.
+        """
+        positions = OrderedDict()
+        for i, text in enumerate(texts):
+            positions.setdefault(cache_key(scorer, version, text), []).append(i)
+        values = [None] * sum(len(p) for p in positions.values())
+        stats = self._stats[scorer]
+        with self._lock:
+            missing = []
+            for key, where in positions.items():
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    for i in where:
+                        values[i] = self._memory[key]
+                    stats["memory_hits"] += 1
+                else:
+                    missing.append(key)
+
+            if missing and self._conn is not None:
+                found = self._disk_get(missing)
+                for key, value in found.items():
+                    self._remember(key, value)
+                    for i in positions[key]:
+                        values[i] = value
+                stats["disk_hits"] += len(found)
+                missing = [key for key in missing if key not in found]
+            stats["misses"] += len(missing)
+        return values
+
+    def put_many(self, scorer, version, texts, values):
+        rows = [(cache_key(scorer, version, text), value) for text, value in zip(texts, values)]
+        with self._lock:
+            for key, value in rows:
+                self._remember(key, value)
+            if self._conn is not None:
+                now = time.time()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO scores (key, created_at, accessed_at, value) VALUES (?, ?, ?, ?)",
+                    [(key, now, now, json.dumps(value)) for key, value in rows],
+                )
+                self._rows += len(rows)
+                if self._rows > self.max_rows:
+                    self._evict()
+                self._conn.commit()
+
+    def memoize(self, scorer, version, texts, compute):
+        """Scores for `texts`, calling `compute(list_of_texts) -> list_of_values` only for cache misses.
+
+        Texts that normalize to the same string within one call are computed once.
+        """
+        texts = list(texts)
+        values = self.get_many(scorer, version, texts)
+        todo = OrderedDict()
+        for i, (text, value) in enumerate(zip(texts, values)):
+            if value is None:
+                todo.setdefault(normalize_text(text), []).append(i)
+        if todo:
+            # Score one representative (original) text per normalized form
+            representatives = [texts[positions[0]] for positions in todo.values()]
+            computed = list(compute(representatives))
+            self.put_many(scorer, version, representatives, computed)
+            for positions, value in zip(todo.values(), computed):
+                for i in positions:
+                    values[i] = value
+        return values
+
+    def stats(self):
+        """Per-scorer memory hits, disk hits, misses and hit rate."""
+        report = {}
+        with self._lock:
+            for scorer, counts in self._stats.items():
+                lookups = sum(counts.values())
+                hits = counts["memory_hits"] + counts["disk_hits"]
+                report[scorer] = dict(counts, hit_rate=hits / lookups if lookups else 0.0)
+            report["memory_items"] = len(self._memory)
+            if self._conn is not None:
+                report["disk_rows"] = self._rows
+        return report
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_score_cache():
+    """Process-wide ScoreCache persisted at DEFAULT_SCORE_CACHE_PATH."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ScoreCache(DEFAULT_SCORE_CACHE_PATH)
+        return _default_cache
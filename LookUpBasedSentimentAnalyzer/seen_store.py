@@ -0,0 +1,215 @@
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 30 * 24 * 3600
+
+
+class RotatingBloom:
+    """Two-generation Bloom filter with a fixed memory footprint.
+
+    New keys go into the current generation; membership checks both. Once the
+    current generation is `span` seconds old or holds `capacity` keys, the old
+    generation is dropped and a fresh one started, so a key is remembered for
+    at least one full generation and at most two. Memory is two bit arrays
+    sized for `capacity` keys at `error_rate`, whatever the traffic.
+    """
+
+    def __init__(self, capacity, error_rate=0.001, span=DEFAULT_TTL):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.span = span
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._current = bytearray((self.num_bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._current_count = 0
+        self._previous_count = 0
+        self._started = time.time()
+
+    @property
+    def nbytes(self):
+        return len(self._current) + len(self._previous)
+
+    def __len__(self):
+        return self._current_count + self._previous_count
+
+    def _positions(self, key):
+        # Double hashing (Kirsch-Mitzenmacher) from one 128-bit digest
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    @staticmethod
+    def _test(bits, positions):
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def __contains__(self, key):
+        positions = self._positions(key)
+        return self._test(self._current, positions) or self._test(self._previous, positions)
+
+    def _maybe_rotate(self, now):
+        if now - self._started >= self.span or self._current_count >= self.capacity:
+            self._previous = self._current
+            self._previous_count = self._current_count
+            self._current = bytearray(len(self._previous))
+            self._current_count = 0
+            self._started = now
+
+    def add(self, key, now=None):
+        self._maybe_rotate(time.time() if now is None else now)
+        positions = self._positions(key)
+        if self._test(self._current, positions):
+            return
+        for p in positions:
+            self._current[p >> 3] |= 1 << (p & 7)
+        self._current_count += 1
+
+
+class SeenStore:
+    """Set of already-processed keys (article links) with expiry and append-only persistence.
+
+    Membership and insertion are O(1). Every new key is appended to a
+    tab-separated log (`timestamp<TAB>key`) on flush() instead of rewriting the
+    whole set, and keys older than `ttl` seconds are forgotten, so the store
+    stays the size of the last `ttl` worth of traffic. The log is compacted
+    (expired lines dropped, atomically) once it is mostly dead lines.
+
+    With `bloom_capacity` set the exact set is replaced by a RotatingBloom of
+    fixed size: memory no longer depends on traffic at all, at the cost of
+    `bloom_error` false positives (an unseen link occasionally treated as seen)
+    and keys being kept between `ttl` and 2 * `ttl`.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TTL, bloom_capacity=None, bloom_error=0.001, compact_min=10_000):
+        self.path = path
+        self.ttl = ttl
+        self.compact_min = compact_min
+        self.bloom = RotatingBloom(bloom_capacity, bloom_error, span=ttl) if bloom_capacity else None
+        self._entries = OrderedDict()
+        self._pending = []
+        self._log_lines = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        now = time.time()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._log_lines += 1
+                    ts, _, key = line.rstrip('\n').partition('\t')
+                    try:
+                        ts = float(ts)
+                    except ValueError:
+                        continue
+                    if key and now - ts < self.ttl:
+                        self._remember(key, ts)
+        except FileNotFoundError:
+            pass
+
+    def _remember(self, key, ts):
+        if self.bloom is not None:
+            self.bloom.add(key, now=ts)
+        elif key not in self._entries:
+            self._entries[key] = ts
+
+    def import_keys(self, keys):
+        """Add keys from a legacy snapshot (e.g. the old seen_links JSON) as seen now."""
+        added = 0
+        for key in keys:
+            added += self.add(key)
+        return added
+
+    def __len__(self):
+        return len(self.bloom) if self.bloom is not None else len(self._entries)
+
+    @staticmethod
+    def _clean(key):
+        # Tabs and newlines would break the log format; lookups must see the key as stored
+        return key.replace('\t', ' ').replace('\n', ' ')
+
+    def __contains__(self, key):
+        key = self._clean(key)
+        with self._lock:
+            if self.bloom is not None:
+                return key in self.bloom
+            self._expire(time.time())
+            return key in self._entries
+
+    def _expire(self, now):
+        # Entries are in insertion (= time) order, so expiry pops from the front
+        entries = self._entries
+        while entries:
+            key, ts = next(iter(entries.items()))
+            if now - ts < self.ttl:
+                break
+            entries.popitem(last=False)
+
+    def add(self, key):
+        """Mark `key` as seen. Returns True if it was not already present."""
+        key = self._clean(key)
+        now = time.time()
+        with self._lock:
+            if self.bloom is not None:
+                if key in self.bloom:
+                    return False
+                self.bloom.add(key, now=now)
+            else:
+                self._expire(now)
+                if key in self._entries:
+                    return False
+                self._entries[key] = now
+            self._pending.append(f'{now:.3f}\t{key}\n')
+        return True
+
+    def flush(self):
+        """Append keys added since the last flush to the log; compact it if mostly expired."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if pending:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.writelines(pending)
+                self._log_lines += len(pending)
+            if self._log_lines > max(self.compact_min, 2 * len(self)):
+                self._compact()
+
+    def _compact(self):
+        # Streams the log rather than dumping memory, so it works in Bloom mode too
+        now = time.time()
+        tmp_path = f'{self.path}.tmp'
+        kept = 0
+        with open(self.path, 'r', encoding='utf-8') as src, open(tmp_path, 'w', encoding='utf-8') as dst:
+            for line in src:
+                ts, _, key = line.partition('\t')
+                try:
+                    if key.strip() and now - float(ts) < self.ttl:
+                        dst.write(line)
+                        kept += 1
+                except ValueError:
+                    continue
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, self.path)
+        self._log_lines = kept
+
+    def stats(self):
+        stats = {'keys': len(self), 'log_lines': self._log_lines, 'pending': len(self._pending)}
+        if self.bloom is not None:
+            stats['bloom_bytes'] = self.bloom.nbytes
+        return stats
+
+
+def open_seen_store(path, legacy_json=None, **kwargs):
+    """SeenStore at `path`, seeded once from an old JSON list of links if one exists."""
+    store = SeenStore(path, **kwargs)
+    if legacy_json and os.path.exists(legacy_json) and not os.path.exists(path):
+        with open(legacy_json, 'r') as f:
+            store.import_keys(json.load(f))
+        store.flush()
+    return store
@@ -0,0 +1,231 @@
+import datetime
+import glob
+import os
+import threading
+import time
+
+import pandas as pd
+
+# Parquet support comes from pyarrow; the CSV log keeps working without it
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+DEFAULT_STORE_PATH = os.path.join('logs', 'sentiment_store')
+LOG_COLUMNS = ['timestamp', 'score', 'num_articles', 'sentiment', 'source']
+ROLLUP_COLUMNS = ['bucket', 'count', 'num_articles', 'score_sum', 'score_min', 'score_max', 'score_mean']
+FREQUENCIES = {'hour': 'h', 'day': 'D'}
+
+
+def _write_atomic(df, path):
+    tmp_path = f'{path}.tmp'
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _aggregate(rows, freq):
+    """Rollup rows (without score_mean) for a frame of raw log rows."""
+    grouped = rows.groupby(rows['timestamp'].dt.floor(FREQUENCIES[freq]))
+    agg = grouped.agg(
+        count=('score', 'size'),
+        num_articles=('num_articles', 'sum'),
+        score_sum=('score', 'sum'),
+        score_min=('score', 'min'),
+        score_max=('score', 'max'),
+    )
+    return agg.rename_axis('bucket').reset_index()
+
+
+def _merge_rollups(existing, new):
+    combined = pd.concat([existing, new], ignore_index=True) if existing is not None else new
+    merged = combined.groupby('bucket', as_index=False).agg(
+        count=('count', 'sum'),
+        num_articles=('num_articles', 'sum'),
+        score_sum=('score_sum', 'sum'),
+        score_min=('score_min', 'min'),
+        score_max=('score_max', 'max'),
+    )
+    merged['score_mean'] = merged['score_sum'] / merged['count']
+    return merged[ROLLUP_COLUMNS]
+
+
+class SentimentLogStore:
+    """Sentiment log as Parquet, partitioned by ticker and date, with hourly and daily rollups.
+
+    Layout under `root`:
+
+        raw/ticker=BA/date=2025-05-06/part-<ns>.parquet   one file per flush
+        hourly/ticker=BA/date=2025-05-06.parquet          <= 24 rows
+        daily/ticker=BA/year=2025.parquet                 <= 366 rows
+
+    append() only buffers; rows are written when `flush_rows` are pending or
+    on flush(). Each flush folds the new rows into the hourly and daily
+    rollups of the partitions it touched (count, article sum, score
+    sum/min/max, mean), so rollups never need a rescan of the raw data.
+    Reads list partition directories and only open the dates in range.
+    Partitions with more than `max_parts` part files are merged on flush.
+
+    read() and rollup() take the same date range: `start` and `end` are both
+    inclusive, and an `end` given as a bare date (2025-05-06, or a
+    datetime.date) covers that whole day. rollup() returns every bucket that
+    overlaps the range.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_PATH, flush_rows=500, max_parts=16):
+        if pyarrow is None:
+            raise ImportError("SentimentLogStore needs pyarrow for Parquet support (pip install pyarrow)")
+        self.root = root
+        self.flush_rows = flush_rows
+        self.max_parts = max_parts
+        self._pending = []
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _raw_dir(self, ticker, date):
+        return os.path.join(self.root, 'raw', f'ticker={ticker}', f'date={date}')
+
+    def _hourly_path(self, ticker, date):
+        return os.path.join(self.root, 'hourly', f'ticker={ticker}', f'date={date}.parquet')
+
+    def _daily_path(self, ticker, year):
+        return os.path.join(self.root, 'daily', f'ticker={ticker}', f'year={year}.parquet')
+
+    def append(self, ticker, timestamp, score, num_articles, sentiment, source='live'):
+        with self._lock:
+            self._pending.append((ticker, timestamp, score, num_articles, sentiment, source))
+            if len(self._pending) >= self.flush_rows:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        rows = pd.DataFrame(self._pending, columns=['ticker'] + LOG_COLUMNS)
+        self._pending = []
+        rows['timestamp'] = pd.to_datetime(rows['timestamp'], format='ISO8601')
+        rows['score'] = rows['score'].astype('float64')
+        rows['num_articles'] = rows['num_articles'].astype('int64')
+        rows['date'] = rows['timestamp'].dt.strftime('%Y-%m-%d')
+
+        for (ticker, date), part in rows.groupby(['ticker', 'date'], sort=False):
+            part = part[LOG_COLUMNS]
+            raw_dir = self._raw_dir(ticker, date)
+            os.makedirs(raw_dir, exist_ok=True)
+            _write_atomic(part, os.path.join(raw_dir, f'part-{time.time_ns()}.parquet'))
+            self._maybe_compact(raw_dir)
+
+            hourly_path = self._hourly_path(ticker, date)
+            self._update_rollup(hourly_path, _aggregate(part, 'hour'))
+            daily_path = self._daily_path(ticker, date[:4])
+            self._update_rollup(daily_path, _aggregate(part, 'day'))
+
+    def _update_rollup(self, path, new):
+        existing = pd.read_parquet(path) if os.path.exists(path) else None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write_atomic(_merge_rollups(existing, new), path)
+
+    def _maybe_compact(self, raw_dir):
+        parts = sorted(glob.glob(os.path.join(raw_dir, 'part-*.parquet')))
+        if len(parts) <= self.max_parts:
+            return
+        merged = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+        _write_atomic(merged, os.path.join(raw_dir, f'part-{time.time_ns()}.parquet'))
+        for path in parts:
+            os.remove(path)
+
+    @staticmethod
+    def _in_range(name, start, end):
+        # `name` is a partition key (YYYY-MM-DD or YYYY), compared on its own precision
+        return (start is None or name >= start[:len(name)]) and (end is None or name <= end[:len(name)])
+
+    def _partitions(self, pattern, prefix, start, end):
+        paths = []
+        for path in sorted(glob.glob(pattern)):
+            name = os.path.basename(path)[len(prefix):].replace('.parquet', '')
+            if self._in_range(name, start, end):
+                paths.append(path)
+        return paths
+
+    @staticmethod
+    def _bounds(start, end):
+        start = pd.Timestamp(start) if start is not None else None
+        if end is not None:
+            date_only = (isinstance(end, str) and len(end.strip()) == 10) or \
+                (isinstance(end, datetime.date) and not isinstance(end, datetime.datetime))
+            end = pd.Timestamp(end)
+            if date_only:
+                end = end + pd.Timedelta(days=1) - pd.Timedelta(1, 'ns')
+        return start, end, (start.strftime('%Y-%m-%d') if start is not None else None), \
+            (end.strftime('%Y-%m-%d') if end is not None else None)
+
+    def tickers(self):
+        raw_root = os.path.join(self.root, 'raw')
+        if not os.path.isdir(raw_root):
+            return []
+        return sorted(name[len('ticker='):] for name in os.listdir(raw_root))
+
+    def fingerprint(self, ticker):
+        """Cheap token that changes whenever rows for `ticker` are flushed (None if there are none).
+
+        Every flush os.replace()s an hourly rollup file into the ticker's
+        directory, which bumps the directory's mtime.
+        """
+        self.flush()
+        try:
+            return os.stat(os.path.join(self.root, 'hourly', f'ticker={ticker}')).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def read(self, ticker, start=None, end=None):
+        """Raw log rows for `ticker` between `start` and `end` (both inclusive), oldest first."""
+        self.flush()
+        start, end, start_key, end_key = self._bounds(start, end)
+        dirs = self._partitions(os.path.join(self.root, 'raw', f'ticker={ticker}', 'date=*'), 'date=', start_key, end_key)
+        frames = [pd.read_parquet(p) for d in dirs for p in sorted(glob.glob(os.path.join(d, 'part-*.parquet')))]
+        if not frames:
+            return pd.DataFrame(columns=LOG_COLUMNS)
+        data = pd.concat(frames, ignore_index=True)
+        if start is not None:
+            data = data[data['timestamp'] >= start]
+        if end is not None:
+            data = data[data['timestamp'] <= end]
+        return data.sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+    def rollup(self, ticker, freq='hour', start=None, end=None):
+        """Pre-aggregated `freq` ('hour' or 'day') buckets for `ticker`: count, articles, score sum/min/max/mean.
+
+        Buckets overlapping `start` to `end` (both inclusive, as in read()) are returned.
+        """
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unknown rollup frequency {freq!r}, choose from {list(FREQUENCIES)}")
+        self.flush()
+        start, end, start_key, end_key = self._bounds(start, end)
+        if freq == 'hour':
+            pattern, prefix = os.path.join(self.root, 'hourly', f'ticker={ticker}', 'date=*.parquet'), 'date='
+        else:
+            pattern, prefix = os.path.join(self.root, 'daily', f'ticker={ticker}', 'year=*.parquet'), 'year='
+        frames = [pd.read_parquet(p) for p in self._partitions(pattern, prefix, start_key, end_key)]
+        if not frames:
+            return pd.DataFrame(columns=ROLLUP_COLUMNS)
+        data = pd.concat(frames, ignore_index=True)
+        if start is not None:
+            data = data[data['bucket'] >= start.floor(FREQUENCIES[freq])]
+        if end is not None:
+            # A bucket overlaps the range when it starts at or before `end`
+            data = data[data['bucket'] <= end]
+        return data.sort_values('bucket').reset_index(drop=True)
+
+    def import_csv(self, ticker, path):
+        """Load an existing sentiment_log_{ticker}.csv into the store. Returns the number of rows."""
+        data = pd.read_csv(path)
+        with self._lock:
+            self._pending.extend(
+                (ticker, row.timestamp, row.score, row.num_articles, row.sentiment, row.source)
+                for row in data.itertuples(index=False)
+            )
+            self._flush()
+        return len(data)
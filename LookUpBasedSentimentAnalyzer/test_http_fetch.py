@@ -0,0 +1,48 @@
+import gzip
+import time
+
+from fixture_server import SAMPLE_FEED, FixtureServer
+from http_fetch import Fetcher
+
+PAGE = b"<html><body>" + b"<p>Acme news</p>" * 200 + b"</body></html>"
+
+
+def test_second_feed_poll_is_a_304_and_skips_the_parse():
+    fetcher = Fetcher()
+    with FixtureServer({'/feed': (SAMPLE_FEED, 'application/rss+xml')}) as server:
+        first = fetcher.fetch_feed(server.url('/feed'))
+        second = fetcher.fetch_feed(server.url('/feed'))
+
+    assert not first.bozo
+    assert len(first.entries) == 40
+    assert [entry.title for entry in first.entries[:2]] == ['Acme beats earnings estimates', 'Acme shares slump on weak guidance']
+    assert second is None
+    stats = fetcher.stats()
+    assert stats['requests'] == 2
+    assert stats['not_modified'] == 1
+    assert stats['parses_skipped'] == 1
+    assert stats['errors'] == 0
+    # Only the first, gzip-compressed body crossed the wire
+    assert stats['bytes_transferred'] == len(gzip.compress(SAMPLE_FEED))
+    assert stats['bytes_transferred'] < len(SAMPLE_FEED)
+    assert server.hits['/feed'] == 2
+
+
+def test_pages_are_decompressed_and_not_conditional():
+    fetcher = Fetcher()
+    with FixtureServer({'/page': (PAGE, 'text/html')}) as server:
+        responses = [fetcher.get(server.url('/page')) for _ in range(2)]
+
+    assert [response.content for response in responses] == [PAGE, PAGE]
+    assert fetcher.stats()['not_modified'] == 0
+
+
+def test_requests_to_one_host_are_spaced_out():
+    fetcher = Fetcher(min_host_interval=0.2)
+    with FixtureServer({'/page': (PAGE, 'text/html')}) as server:
+        start = time.monotonic()
+        for _ in range(3):
+            fetcher.get(server.url('/page'))
+        elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.4
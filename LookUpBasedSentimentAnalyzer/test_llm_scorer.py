@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+pytest.importorskip("langchain_core")
+ChatOllama = pytest.importorskip("langchain_ollama").ChatOllama
+
+from llm_scorer import LLMScorer
+from ollama_stub import serve
+
+HEADLINES = [
+    "Acme posts record profit and strong growth",
+    "Acme faces lawsuit after product recall",
+    "Acme {holds} annual meeting",
+    "Acme beats estimates } shares surge",
+]
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**kwargs):
+        server = serve(port=0, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_scorer(server, **kwargs):
+    host, port = server.server_address
+    llm = ChatOllama(model="llama2", temperature=0.1, base_url=f"http://{host}:{port}")
+    return LLMScorer(llm, backoff_initial=0.01, backoff_max=0.05, **kwargs)
+
+
+def test_scores_headlines_including_braces(stub):
+    scorer = make_scorer(stub())
+    results = scorer.score(HEADLINES)
+
+    assert [sentiment for sentiment, *_ in results] == ["positive", "negative", "neutral", "positive"]
+    assert results[0][1] > 0 > results[1][1]
+
+
+def test_cached_answers_are_not_requested_again(stub, tmp_path):
+    server = stub()
+    first = make_scorer(server, cache_dir=str(tmp_path)).score(HEADLINES + HEADLINES[:1])
+    assert server.requests == len(HEADLINES)
+
+    again = make_scorer(server, cache_dir=str(tmp_path))
+    assert again.score(HEADLINES) == first[:len(HEADLINES)]
+    assert server.requests == len(HEADLINES)
+    assert again.cache_hits == len(HEADLINES)
+
+
+def test_failed_requests_are_retried(stub):
+    server = stub(fail_first=2)
+    scorer = make_scorer(server, max_concurrency=1, max_attempts=3)
+    results = scorer.score(HEADLINES[:2])
+
+    assert [sentiment for sentiment, *_ in results] == ["positive", "negative"]
+    assert server.requests == 4
+
+
+def test_exhausted_retries_give_the_error_result(stub):
+    scorer = make_scorer(stub(fail_first=10), max_concurrency=1, max_attempts=2)
+    assert scorer.score(HEADLINES[:1]) == [("error", 0, "", "")]
@@ -0,0 +1,69 @@
+import score_cache
+from score_cache import ScoreCache
+
+
+def test_memory_tier_is_an_lru_of_max_items():
+    cache = ScoreCache(max_items=2)
+    cache.put_many("s", "1", ["a", "b"], [1, 2])
+    cache.get_many("s", "1", ["a"])
+    cache.put_many("s", "1", ["c"], [3])
+
+    assert cache.get_many("s", "1", ["a", "b", "c"]) == [1, None, 3]
+    assert cache.stats()["memory_items"] == 2
+
+
+def test_scores_persist_across_instances(tmp_path):
+    path = str(tmp_path / "scores.sqlite")
+    first = ScoreCache(path)
+    first.put_many("s", "1", ["Acme  beats\nestimates"], [[0.1, 0.9]])
+    first.close()
+
+    second = ScoreCache(path)
+    assert second.get_many("s", "1", ["Acme beats estimates"]) == [[0.1, 0.9]]
+    assert second.get_many("s", "2", ["Acme beats estimates"]) == [None]
+    assert second.stats()["s"]["disk_hits"] == 1
+
+
+def test_expired_scores_are_missing(tmp_path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(score_cache.time, "time", lambda: now[0])
+    path = str(tmp_path / "scores.sqlite")
+    ScoreCache(path, ttl=60).put_many("s", "1", ["old"], [1])
+
+    now[0] += 61
+    reopened = ScoreCache(path, ttl=60)
+    assert reopened.get_many("s", "1", ["old"]) == [None]
+    assert reopened.stats()["disk_rows"] == 0
+
+
+def test_disk_is_trimmed_to_max_rows_least_recently_read_first(tmp_path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(score_cache.time, "time", lambda: now[0])
+    cache = ScoreCache(str(tmp_path / "scores.sqlite"), max_items=1, max_rows=10)
+    for i in range(10):
+        now[0] += 1
+        cache.put_many("s", "1", [f"text {i}"], [i])
+    now[0] += 1
+    cache.get_many("s", "1", ["text 0"])  # read from disk, so no longer the oldest
+
+    cache.put_many("s", "1", ["text 10"], [10])
+
+    assert cache.stats()["disk_rows"] == 9
+    assert cache.get_many("s", "1", ["text 0", "text 1", "text 2", "text 10"]) == [0, None, None, 10]
+
+
+def test_duplicates_in_one_call_count_once():
+    cache = ScoreCache()
+    calls = []
+
+    def compute(texts):
+        calls.append(list(texts))
+        return [len(text) for text in texts]
+
+    assert cache.memoize("s", "1", ["a b", "a  b", "c"], compute) == [3, 3, 1]
+    assert calls == [["a b", "c"]]
+    assert cache.memoize("s", "1", ["a b", "a b", "d"], compute) == [3, 3, 1]
+
+    stats = cache.stats()["s"]
+    assert (stats["memory_hits"], stats["misses"]) == (1, 3)
+    assert stats["hit_rate"] == 0.25
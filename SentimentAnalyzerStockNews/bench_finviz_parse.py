@@ -0,0 +1,41 @@
+import argparse
+import os
+import time
+
+from finviz_parse import BACKENDS, available_backends, describe_backend, extract_news_links, extract_tickers, parse_news_rows
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+FIXTURE = os.path.join(script_dir, "fixtures", "finviz_news.html")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Finviz news page parsing backends on a saved fixture")
+    parser.add_argument("--fixture", default=FIXTURE)
+    parser.add_argument("--repeats", type=int, default=50, help="Parses per extractor and backend")
+    args = parser.parse_args()
+
+    with open(args.fixture, "r", encoding="utf-8") as f:
+        html = f.read()
+
+    backends = available_backends()
+    print(f"{os.path.basename(args.fixture)} ({len(html) / 1024:.0f} KiB), backends: {', '.join(backends)}; default: {describe_backend()}")
+    for backend in BACKENDS:
+        if backend not in backends:
+            print(f"  {backend} is NOT installed/importable and is not measured")
+
+    for extract in (parse_news_rows, extract_news_links, extract_tickers):
+        reference = extract(html, backend="bs4")
+        baseline = None
+        print(f"\n{extract.__name__}")
+        for backend in reversed(backends):
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                result = extract(html, backend=backend)
+            elapsed = (time.perf_counter() - start) / args.repeats
+            baseline = baseline or elapsed
+            same = "same output" if result == reference else "DIFFERS from bs4"
+            print(f"  {backend:>10}: {elapsed * 1000:7.2f} ms/page  {baseline / elapsed:5.1f}x  {same}  [{describe_backend(backend)}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import os
+import re
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from news_pipeline import process_datetime, process_news_frame, vader
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+SEED_CSV = os.path.join(script_dir, '..', 'finviz_sentiment_data.csv')
+
+
+def make_frame(n, seed=0):
+    """Finviz-shaped news frame of `n` rows resampled from the scraped CSV.
+
+    Titles repeat across rows (as syndicated headlines do across tickers),
+    dates come in both Finviz formats ('03:45PM' and '05/11/25') and tickers
+    carry stray whitespace.
+    """
+    rng = np.random.default_rng(seed)
+    seed_df = pd.read_csv(SEED_CSV)
+    rows = seed_df.iloc[rng.integers(0, len(seed_df), n)].reset_index(drop=True)
+
+    dates = pd.to_datetime(rows['date']).dt.strftime('%m/%d/%y')
+    use_time = rng.random(n) < 0.7
+    padded_ticker = np.where(rng.random(n) < 0.1, '  ' + rows['ticker'] + ' \t', rows['ticker'])
+    return pd.DataFrame({
+        'Ticker': padded_ticker,
+        'Date': np.where(use_time, rows['time'], dates),
+        'Title': rows['title'],
+    })
+
+
+def process_news_iterrows(news_df, time_col='Date', title_col='Title', ticker_col='Ticker'):
+    """The previous row-at-a-time process_news loop, kept as the reference implementation."""
+    data = []
+    for _, row in news_df.iterrows():
+        title = row.get(title_col, '')
+        time_str = row.get(time_col, '')
+        ticker = row.get(ticker_col, '') if ticker_col else ''
+
+        if title and time_str:
+            dt = process_datetime(time_str)
+            if isinstance(ticker, str):
+                ticker = re.sub(r'\s+', ' ', ticker).strip()
+
+            sentiment_scores = vader.polarity_scores(title)
+            compound = sentiment_scores['compound']
+            sentiment = 'Positive' if compound > 0.05 else 'Negative' if compound < -0.05 else 'Neutral'
+            data.append([ticker, dt, title, compound, sentiment])
+
+    return pd.DataFrame(data, columns=['ticker', 'datetime', 'title', 'compound', 'sentiment'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark columnar process_news against the iterrows loop')
+    parser.add_argument('--n', type=int, default=100_000, help='Rows in the synthetic news frame')
+    parser.add_argument('--workers', type=int, default=0, help='Process pool size for VADER (0 = in process)')
+    args = parser.parse_args()
+
+    news_df = make_frame(args.n)
+    print(f"{len(news_df)} rows, {news_df['Title'].nunique()} distinct titles (seeded from {os.path.basename(SEED_CSV)})")
+    now = datetime.now()
+
+    start = time.perf_counter()
+    expected = process_news_iterrows(news_df)
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = process_news_frame(news_df, 'Date', 'Title', 'Ticker', workers=args.workers, now=now)
+    elapsed = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    print(f"iterrows loop : {baseline:.2f}s ({len(news_df) / baseline:,.0f} rows/s)")
+    print(f"columnar      : {elapsed:.2f}s ({len(news_df) / elapsed:,.0f} rows/s), {baseline / elapsed:.1f}x, same output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import threading
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+import requests
+
+from finviz_parse import parse_news_rows
+
+NEWS_URL = 'https://finviz.com/news.ashx?v=3'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+@dataclass(frozen=True)
+class NewsRecord:
+    time: str
+    title: str
+    url: str
+    tickers: tuple = ()
+
+
+def parse_records(html, backend=None):
+    """NewsRecords for every row of a Finviz news page, in page order (newest first)."""
+    return [NewsRecord(row['time'], row['title'], row['url'], tuple(row['tickers'])) for row in parse_news_rows(html, backend)]
+
+
+def records_frame(records):
+    """One row per (record, linked ticker), with an empty ticker for untagged headlines.
+
+    The Date / Title / Ticker columns are what process_news expects.
+    """
+    return pd.DataFrame(
+        [{'Date': r.time, 'Title': r.title, 'Url': r.url, 'Ticker': ticker}
+         for r in records for ticker in (r.tickers or ('',))],
+        columns=['Date', 'Title', 'Url', 'Ticker'],
+    )
+
+
+class FinvizNewsFeed:
+    """Fetches and parses the Finviz news page once per cycle and fans the records out.
+
+    Consumers registered with subscribe() are called with the list of
+    NewsRecords after every poll(), so however many consumers there are, a
+    cycle costs one request. A consumer that raises is reported in `errors`
+    without stopping the others.
+    """
+
+    def __init__(self, url=NEWS_URL, user_agent=USER_AGENT, timeout=15, backend=None, session=None):
+        self.url = url
+        self.timeout = timeout
+        self.backend = backend
+        self.session = session or requests.Session()
+        self.session.headers.update({'User-Agent': user_agent})
+        self.consumers = []
+        self.records = []
+        self.fetched_at = None
+        self.requests = 0
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, consumer):
+        self.consumers.append(consumer)
+        return consumer
+
+    def fetch(self):
+        """One request and one parse; returns the records and keeps them as `records`."""
+        response = self.session.get(self.url, timeout=self.timeout)
+        response.raise_for_status()
+        records = parse_records(response.text, self.backend)
+        with self._lock:
+            self.requests += 1
+            self.records = records
+            self.fetched_at = time.monotonic()
+        return records
+
+    def poll(self):
+        """Fetch once and hand the records to every subscriber."""
+        records = self.fetch()
+        for consumer in self.consumers:
+            name = getattr(consumer, '__name__', repr(consumer))
+            try:
+                consumer(records)
+            except Exception as e:
+                self.errors[name] = f"{type(e).__name__}: {e}"
+        return records
+
+    def run(self, interval=120, cycles=None):
+        """poll() every `interval` seconds, `cycles` times (forever if None)."""
+        cycle = 0
+        while cycles is None or cycle < cycles:
+            start = time.monotonic()
+            try:
+                self.poll()
+            except requests.RequestException as e:
+                print(f"Finviz news fetch failed: {e}")
+            cycle += 1
+            if cycles is None or cycle < cycles:
+                time.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+
+_default_feed = None
+_default_lock = threading.Lock()
+
+
+def default_feed():
+    """Process-wide FinvizNewsFeed shared by the scrapers and the app."""
+    global _default_feed
+    with _default_lock:
+        if _default_feed is None:
+            _default_feed = FinvizNewsFeed()
+        return _default_feed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from data_scraper import print_headlines
+    from news_pipeline import process_news_frame
+    from shared_cache import default_score_cache
+    from ticker import print_tickers
+
+    parser = argparse.ArgumentParser(description="Poll the Finviz news page once per cycle and fan it out to every consumer")
+    parser.add_argument('--interval', type=int, default=120, help='Seconds between polls')
+    parser.add_argument('--cycles', type=int, default=1, help='Number of polls (0 = run forever)')
+    args = parser.parse_args()
+
+    feed = default_feed()
+    score_cache = default_score_cache()
+
+    feed.subscribe(print_headlines)
+    feed.subscribe(print_tickers)
+
+    @feed.subscribe
+    def score_headlines(records):
+        df = process_news_frame(records_frame(records), 'Date', 'Title', 'Ticker', cache=score_cache)
+        tagged = df[df['ticker'] != '']
+        print("\nAverage sentiment by ticker:")
+        print(tagged.groupby('ticker')['compound'].mean().sort_values(ascending=False).head(15))
+
+    feed.run(args.interval, args.cycles or None)
+    print(f"\n{feed.requests} request(s) to {feed.url}, consumer errors: {feed.errors or 'none'}")
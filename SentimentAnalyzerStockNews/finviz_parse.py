@@ -0,0 +1,135 @@
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+# Fast parsers are optional; BeautifulSoup's html.parser is always available as the fallback
+# selectolax 1.0 dropped the Modest `parser` module; the Lexbor parser has the same node API
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+BACKENDS = ("selectolax", "lxml", "bs4")
+FINVIZ_URL = "https://finviz.com/"
+NEWS_ROWS_XPATH = "//table[contains(concat(' ', normalize-space(@class), ' '), ' fullview-news-outer ')]//tr"
+NEWS_LINKS_XPATH = "//a[contains(concat(' ', normalize-space(@class), ' '), ' tab-link-news ')][@href]"
+
+
+def available_backends():
+    return [b for b in BACKENDS if b == "bs4" or (b == "selectolax" and HTMLParser) or (b == "lxml" and lxml)]
+
+
+def default_backend():
+    return available_backends()[0]
+
+
+def _check(backend):
+    backend = backend or default_backend()
+    if backend not in available_backends():
+        raise ValueError(f"HTML backend {backend!r} is not available, choose from {available_backends()}")
+    return backend
+
+
+def describe_backend(backend=None):
+    """The backend that `backend` resolves to and the parser behind it, e.g. for benchmark output."""
+    backend = _check(backend)
+    if backend == "selectolax":
+        return f"selectolax ({HTMLParser.__module__}.{HTMLParser.__name__})"
+    if backend == "lxml":
+        return f"lxml {lxml.etree.__version__}"
+    return "bs4 (html.parser)"
+
+
+def ticker_from_href(href):
+    if 'quote.ashx?t=' not in href:
+        return None
+    return href.split('quote.ashx?t=')[1].split('&')[0].split('#')[0].upper() or None
+
+
+def _row(time_text, links):
+    """Build a news record from a row's time cell text and the (text, href) links of its headline cell."""
+    title, href = links[0]
+    tickers = []
+    for _, link_href in links:
+        ticker = ticker_from_href(link_href)
+        if ticker and ticker not in tickers:
+            tickers.append(ticker)
+    return {
+        'time': time_text.strip(),
+        'title': title.strip(),
+        'url': urljoin(FINVIZ_URL, href),
+        'tickers': tickers,
+    }
+
+
+def parse_news_rows(html, backend=None):
+    """Rows of the Finviz news table (news.ashx): time, headline, absolute url and linked tickers."""
+    backend = _check(backend)
+    records = []
+
+    if backend == "selectolax":
+        for row in HTMLParser(html).css("table.fullview-news-outer tr"):
+            cells = [child for child in row.iter() if child.tag == "td"]
+            if len(cells) < 2:
+                continue
+            links = [(a.text(), a.attributes.get("href") or "") for a in cells[1].css("a[href]")]
+            if links:
+                records.append(_row(cells[0].text(), links))
+        return records
+
+    if backend == "lxml":
+        doc = lxml.html.fromstring(html) if html else None
+        for row in (doc.xpath(NEWS_ROWS_XPATH) if doc is not None else []):
+            cells = row.xpath("./td")
+            if len(cells) < 2:
+                continue
+            links = [(a.text_content(), a.get("href")) for a in cells[1].xpath(".//a[@href]")]
+            if links:
+                records.append(_row(cells[0].text_content(), links))
+        return records
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for row in soup.select('table.fullview-news-outer tr'):
+        cells = row.find_all('td', recursive=False)
+        if len(cells) < 2:
+            continue
+        links = [(a.text, a['href']) for a in cells[1].find_all('a', href=True)]
+        if links:
+            records.append(_row(cells[0].text, links))
+    return records
+
+
+def extract_news_links(html, backend=None):
+    """(headline, absolute url) for every `a.tab-link-news` on the page."""
+    backend = _check(backend)
+    if backend == "selectolax":
+        anchors = [(a.text(), a.attributes.get("href") or "") for a in HTMLParser(html).css("a.tab-link-news[href]")]
+    elif backend == "lxml":
+        doc = lxml.html.fromstring(html) if html else None
+        anchors = [(a.text_content(), a.get("href")) for a in (doc.xpath(NEWS_LINKS_XPATH) if doc is not None else [])]
+    else:
+        soup = BeautifulSoup(html, 'html.parser')
+        anchors = [(a.text, a['href']) for a in soup.find_all('a', class_='tab-link-news', href=True)]
+    return [(text.strip(), urljoin(FINVIZ_URL, href)) for text, href in anchors]
+
+
+def extract_tickers(html, backend=None):
+    """Every ticker symbol linked from the page via quote.ashx?t=..."""
+    backend = _check(backend)
+    if backend == "selectolax":
+        hrefs = [a.attributes.get("href") or "" for a in HTMLParser(html).css('a[href*="quote.ashx?t="]')]
+    elif backend == "lxml":
+        doc = lxml.html.fromstring(html) if html else None
+        hrefs = doc.xpath("//a[contains(@href, 'quote.ashx?t=')]/@href") if doc is not None else []
+    else:
+        soup = BeautifulSoup(html, 'html.parser')
+        hrefs = [a['href'] for a in soup.find_all('a', href=True)]
+    return {t for t in map(ticker_from_href, hrefs) if t}
@@ -1,20 +1,12 @@
 import pandas as pd
-from datetime import datetime
-import nltk
 import matplotlib.pyplot as plt
 import seaborn as sns
-import re
 from finvizfinance.news import News
-from finvizfinance.quote import finvizfinance
-
-# Download VADER if not already available
-try:
-    from nltk.sentiment.vader import SentimentIntensityAnalyzer
-except ImportError:
-    nltk.download('vader_lexicon')
-    from nltk.sentiment.vader import SentimentIntensityAnalyzer
-
-vader = SentimentIntensityAnalyzer()
+from news_pipeline import process_news_frame
+# process_datetime and vader used to be defined here; re-exported for existing `from main import ...` callers
+from news_pipeline import process_datetime, vader  # noqa: F401
+from shared_cache import default_score_cache
+from ticker_news import TickerNewsFetcher
 
 # Get general finviz news (fallback method)
 def get_finviz_news():
@@ -38,29 +30,27 @@ def get_finviz_news():
         print(f"Error fetching news with finvizfinance: {e}")
         return None
 
-# Get stock specific news from finvizfinance
-def get_stock_news(ticker_symbols=None):
+def _ticker_list(ticker_symbols):
     if ticker_symbols is None:
-        ticker_symbols = ['AAPL', 'MSFT', 'AMZN', 'GOOGL', 'META']
-
+        return ['AAPL', 'MSFT', 'AMZN', 'GOOGL', 'META']
     if isinstance(ticker_symbols, str):
-        ticker_symbols = [ticker_symbols]
+        return [ticker_symbols]
+    return ticker_symbols
 
-    all_news = []
+# Per-ticker news as each ticker's fetch completes (concurrent, rate limited)
+def iter_stock_news(ticker_symbols=None, fetcher=None):
+    ticker_symbols = _ticker_list(ticker_symbols)
+    fetcher = fetcher or TickerNewsFetcher()
 
-    for ticker in ticker_symbols:
-        try:
-            print(f"Fetching news for {ticker}...")
-            stock = finvizfinance(ticker)
-            stock_news = stock.ticker_news()
+    print(f"Fetching news for {len(ticker_symbols)} tickers...")
+    for ticker, stock_news in fetcher.iter_news(ticker_symbols):
+        print(f"Found {len(stock_news)} news items for {ticker}")
+        yield ticker, stock_news
+    print(fetcher.report)
 
-            if stock_news is not None and len(stock_news) > 0:
-                if 'Ticker' not in stock_news.columns:
-                    stock_news['Ticker'] = ticker
-                all_news.append(stock_news)
-                print(f"Found {len(stock_news)} news items for {ticker}")
-        except Exception as e:
-            print(f"Error fetching news for {ticker}: {e}")
+# Get stock specific news from finvizfinance
+def get_stock_news(ticker_symbols=None, fetcher=None):
+    all_news = [stock_news for _, stock_news in iter_stock_news(ticker_symbols, fetcher)]
 
     if all_news:
         return pd.concat(all_news, ignore_index=True)
@@ -68,28 +58,8 @@ def get_stock_news(ticker_symbols=None):
         print("No stock-specific news found. Fetching general market news...")
         return get_finviz_news()
 
-# Process datetime strings from Finviz
-def process_datetime(time_str):
-    if not isinstance(time_str, str):
-        return None
-
-    current_date = datetime.now()
-
-    try:
-        if re.match(r'\d{1,2}:\d{2}(AM|PM)', time_str):
-            dt = datetime.strptime(time_str, '%I:%M%p')
-            return dt.replace(year=current_date.year, month=current_date.month, day=current_date.day)
-        elif re.match(r'\d{1,2}/\d{1,2}/\d{2,4}', time_str):
-            return datetime.strptime(time_str, '%m/%d/%y')
-        elif isinstance(time_str, datetime):
-            return time_str
-    except ValueError:
-        return None
-
-    return None
-
 # Process news data
-def process_news(news_data):
+def process_news(news_data, workers=0, cache=None):
     if news_data is None:
         print("No news data available.")
         return pd.DataFrame()
@@ -118,23 +88,17 @@ def process_news(news_data):
         print(f"Missing required columns. Available columns: {news_df.columns.tolist()}")
         return pd.DataFrame()
 
-    data = []
-    for _, row in news_df.iterrows():
-        title = row.get(title_col, '')
-        time_str = row.get(time_col, '')
-        ticker = row.get(ticker_col, '') if ticker_col else ''
+    return process_news_frame(news_df, time_col, title_col, ticker_col, workers=workers, cache=cache)
 
-        if title and time_str:
-            dt = process_datetime(time_str)
-            if isinstance(ticker, str):
-                ticker = re.sub(r'\s+', ' ', ticker).strip()
+# Fetch and score stock news; each ticker is scored as soon as its news arrives
+def process_stock_news(ticker_symbols=None, fetcher=None, cache=None):
+    processed = [process_news(stock_news, cache=cache) for _, stock_news in iter_stock_news(ticker_symbols, fetcher)]
+    processed = [df for df in processed if not df.empty]
 
-            sentiment_scores = vader.polarity_scores(title)
-            compound = sentiment_scores['compound']
-            sentiment = 'Positive' if compound > 0.05 else 'Negative' if compound < -0.05 else 'Neutral'
-            data.append([ticker, dt, title, compound, sentiment])
-
-    return pd.DataFrame(data, columns=['ticker', 'datetime', 'title', 'compound', 'sentiment'])
+    if processed:
+        return pd.concat(processed, ignore_index=True)
+    print("No stock-specific news found. Fetching general market news...")
+    return process_news(get_finviz_news(), cache=cache)
 
 # Visualizations
 def create_visualizations(df):
@@ -178,12 +142,10 @@ def main():
         custom_tickers = [ticker.strip().upper() for ticker in user_input.split(',')]
         tickers = custom_tickers
 
-    news_df = get_stock_news(tickers)
-
-    if news_df is not None and hasattr(news_df, 'columns'):
-        print("Sample news data:", news_df.head(2))
-
-    df = process_news(news_df)
+    # Headlines syndicated across tickers, or seen on an earlier run, are scored once
+    score_cache = default_score_cache()
+    df = process_stock_news(tickers, cache=score_cache)
+    print(f"Score cache: {score_cache.stats()}")
 
     if df.empty:
         print("No data found or error in fetching news.")
@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import deque
+from itertools import islice
+
+
+class NewsIngestor:
+    """Calls `poll()` every `interval` seconds on one daemon thread and keeps the newest items.
+
+    `poll` drives one fetch cycle, e.g. FinvizNewsFeed.poll, whose subscribed
+    consumer hands the new item dicts (newest first) to add(). Each stored
+    item gets an increasing `seq` number, so readers can tell which items
+    they have not shown yet without refetching. At most `max_items` items are
+    kept. All readers share the same items; none of them ever waits on a fetch.
+    """
+
+    def __init__(self, poll, interval=120, max_items=5000):
+        self.poll = poll
+        self.interval = interval
+        self._items = deque(maxlen=max_items)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.latest_seq = 0
+        self.fetches = 0
+        self.last_fetch = None
+        self.last_error = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="news-ingestor", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval)
+
+    def refresh(self):
+        """Run one poll now; errors are kept in `last_error` instead of killing the worker."""
+        try:
+            self.poll()
+        except Exception as e:
+            self.fail(e)
+
+    def fail(self, error):
+        """Report a failed cycle in `last_error`, e.g. from a consumer whose errors poll() swallows."""
+        with self._lock:
+            self.last_error = f"{type(error).__name__}: {error}"
+
+    def add(self, items):
+        """Store one cycle's new items (newest first)."""
+        with self._lock:
+            # Oldest first, so the newest item ends up at the front with the highest seq
+            for item in reversed(items):
+                self.latest_seq += 1
+                self._items.appendleft(dict(item, seq=self.latest_seq))
+            self.fetches += 1
+            self.last_fetch = time.time()
+            self.last_error = None
+
+    def snapshot(self, page=0, page_size=50, seen=()):
+        """One consistent view for rendering, taken under a single lock.
+
+        Holds the items of `page` (0-based, clamped to the last page), newest
+        first, the page count, how many stored items have a seq not in `seen`
+        (the seqs the reader has shown, on any page), the oldest stored seq
+        so readers can forget older ones, and the fetch status.
+        """
+        with self._lock:
+            total = len(self._items)
+            pages = max(1, -(-total // page_size))
+            page = min(max(page, 0), pages - 1)
+            new_count = sum(item["seq"] not in seen for item in self._items)
+            return {
+                "items": list(islice(self._items, page * page_size, (page + 1) * page_size)),
+                "page": page,
+                "pages": pages,
+                "total": total,
+                "new_count": new_count,
+                "latest_seq": self.latest_seq,
+                "oldest_seq": self._items[-1]["seq"] if self._items else self.latest_seq + 1,
+                "fetches": self.fetches,
+                "last_fetch": self.last_fetch,
+                "last_error": self.last_error,
+            }
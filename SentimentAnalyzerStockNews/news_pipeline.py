@@ -0,0 +1,163 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import nltk
+import numpy as np
+import pandas as pd
+
+# Download VADER if not already available
+try:
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+except ImportError:
+    nltk.download('vader_lexicon')
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+vader = SentimentIntensityAnalyzer()
+# Score cache version: VADER's lexicon and rules ship with nltk
+VADER_VERSION = f"nltk-{nltk.__version__}"
+
+TIME_PATTERN = r'\d{1,2}:\d{2}(?:AM|PM)'
+DATE_PATTERN = r'\d{1,2}/\d{1,2}/\d{2,4}'
+RESULT_COLUMNS = ['ticker', 'datetime', 'title', 'compound', 'sentiment']
+
+
+# Process datetime strings from Finviz
+def process_datetime(time_str):
+    if not isinstance(time_str, str):
+        return None
+
+    current_date = datetime.now()
+
+    try:
+        if re.match(TIME_PATTERN, time_str):
+            dt = datetime.strptime(time_str, '%I:%M%p')
+            return dt.replace(year=current_date.year, month=current_date.month, day=current_date.day)
+        elif re.match(DATE_PATTERN, time_str):
+            return datetime.strptime(time_str, '%m/%d/%y')
+    except ValueError:
+        return None
+
+    return None
+
+
+def parse_datetimes(values, now=None):
+    """Vectorized process_datetime over a Series: '03:45PM' is today at that time, '05/11/25' a date.
+
+    Strings in neither format (or not matching them exactly) become NaT;
+    values that are already datetimes are kept as they are.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return pd.Series(values.to_numpy(), index=values.index)
+
+    # Work on a fresh RangeIndex so masks line up even if the frame's index has duplicates
+    index = values.index
+    values = values.reset_index(drop=True)
+    result = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    types = values.map(type)
+    is_str = types.eq(str)
+    strings = values[is_str].astype(str)
+
+    # Same precedence as process_datetime: time-of-day first, then m/d/y
+    time_mask = strings.str.match(TIME_PATTERN)
+    if time_mask.any():
+        times = pd.to_datetime(strings[time_mask], format='%I:%M%p', errors='coerce')
+        today = pd.Timestamp(now or datetime.now()).floor('D')
+        result[time_mask[time_mask].index] = today + (times - times.dt.floor('D'))
+
+    date_mask = ~time_mask & strings.str.match(DATE_PATTERN)
+    if date_mask.any():
+        result[date_mask[date_mask].index] = pd.to_datetime(strings[date_mask], format='%m/%d/%y', errors='coerce')
+
+    # Real datetimes passed through unchanged
+    is_datetime = types.isin([datetime, pd.Timestamp])
+    if is_datetime.any():
+        result[is_datetime] = pd.to_datetime(values[is_datetime])
+    result.index = index
+    return result
+
+
+def normalize_tickers(values):
+    """Collapse whitespace runs to one space and strip, for string entries only."""
+    index = values.index
+    values = values.reset_index(drop=True)
+    is_str = values.map(type).eq(str)
+    cleaned = values.where(~is_str, values[is_str].str.replace(r'\s+', ' ', regex=True).str.strip())
+    cleaned.index = index
+    return cleaned
+
+
+def label_sentiment(compound):
+    compound = np.asarray(compound, dtype=np.float64)
+    return np.select([compound > 0.05, compound < -0.05], ['Positive', 'Negative'], 'Neutral')
+
+
+_worker_vader = None
+
+def _init_worker():
+    global _worker_vader
+    _worker_vader = SentimentIntensityAnalyzer()
+
+def _compound_chunk(titles):
+    return [_worker_vader.polarity_scores(title)['compound'] for title in titles]
+
+
+def _compound_scores(titles, workers, chunk_size, parallel_threshold):
+    if workers and len(titles) >= parallel_threshold:
+        chunks = [titles[i:i + chunk_size] for i in range(0, len(titles), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            return [score for chunk in pool.map(_compound_chunk, chunks) for score in chunk]
+    return [vader.polarity_scores(title)['compound'] for title in titles]
+
+
+def score_titles(titles, workers=0, chunk_size=2000, parallel_threshold=20000, cache=None):
+    """VADER compound score per title; each distinct title is scored once.
+
+    With `workers` > 0 and at least `parallel_threshold` distinct titles, the
+    distinct titles are scored in chunks on a process pool. With a ScoreCache
+    as `cache`, string titles scored in earlier calls (or by other tickers and
+    scripts sharing the cache) are not scored again.
+    """
+    codes, uniques = pd.factorize(pd.Series(titles, dtype=object), use_na_sentinel=False)
+    uniques = list(uniques)
+
+    def compute(batch):
+        return _compound_scores(batch, workers, chunk_size, parallel_threshold)
+
+    if cache is None:
+        unique_scores = compute(uniques)
+    else:
+        # Only strings are cacheable; anything else goes to VADER as before
+        unique_scores = [None] * len(uniques)
+        strings = [i for i, title in enumerate(uniques) if isinstance(title, str)]
+        others = [i for i, title in enumerate(uniques) if not isinstance(title, str)]
+        for i, score in zip(strings, cache.memoize('vader', VADER_VERSION, [uniques[i] for i in strings], compute)):
+            unique_scores[i] = score
+        for i, score in zip(others, compute([uniques[i] for i in others])):
+            unique_scores[i] = score
+
+    return np.asarray(unique_scores, dtype=np.float64)[codes]
+
+
+def _truthy(values):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.notna().to_numpy()
+    return values.to_numpy(dtype=object).astype(bool)
+
+
+def process_news_frame(news_df, time_col, title_col, ticker_col=None, workers=0, now=None, cache=None):
+    """Columnar process_news: ticker, datetime, title, VADER compound and label per usable row."""
+    keep = _truthy(news_df[title_col]) & _truthy(news_df[time_col])
+    frame = news_df.loc[keep]
+
+    titles = frame[title_col]
+    tickers = normalize_tickers(frame[ticker_col]) if ticker_col else pd.Series('', index=frame.index)
+    compound = score_titles(titles.to_numpy(dtype=object), workers=workers, cache=cache)
+
+    return pd.DataFrame({
+        'ticker': tickers.to_numpy(),
+        'datetime': parse_datetimes(frame[time_col], now=now).to_numpy(),
+        'title': titles.to_numpy(),
+        'compound': compound,
+        'sentiment': label_sentiment(compound),
+    }, columns=RESULT_COLUMNS)
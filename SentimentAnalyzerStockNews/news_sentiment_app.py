@@ -1,68 +1,110 @@
-import requests
-from bs4 import BeautifulSoup
+import os
+from finviz_feed import default_feed
+from news_ingestor import NewsIngestor
+from recent_set import RecentSet
+from shared_cache import default_score_cache
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from importlib.metadata import version
 import streamlit as st
 import time
 
+# One shared feed poll per interval for every session; the UI refresh only reads what was ingested
+FETCH_INTERVAL = int(os.getenv('NEWS_FETCH_INTERVAL', '120'))
+
 # Set up the VADER sentiment analyzer
 analyzer = SentimentIntensityAnalyzer()
-
-# Keep track of seen headlines to avoid duplication
-seen_headlines = set()
-
-def fetch_news():
-    url = "https://finviz.com/news.ashx?v=3"
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    response = requests.get(url, headers=headers)
-
-    soup = BeautifulSoup(response.text, 'html.parser')
-    rows = soup.select('table.fullview-news-outer tr')
+# Scores persist across app restarts; vaderSentiment scores differ slightly from nltk's, hence its own version
+VADER_VERSION = f"vaderSentiment-{version('vaderSentiment')}"
+score_cache = default_score_cache()
+
+# Keep track of seen headlines to avoid duplication; bounded so a long-running app stays flat in memory
+seen_headlines = RecentSet(ttl=24 * 3600, max_items=50_000)
+
+# Scores the headlines of one poll that were not seen before; the consumer marks them seen once stored
+def score_news(records):
+    new_records = {}
+    for record in records:
+        if record.title not in seen_headlines:  # Skip already seen headlines
+            new_records.setdefault(record.title, record)
+    new_records = list(new_records.values())
+
+    scores = score_cache.memoize(
+        'vader', VADER_VERSION, [record.title for record in new_records],
+        lambda headlines: [analyzer.polarity_scores(headline)['compound'] for headline in headlines],
+    )
 
     news_items = []
-    for row in rows:
-        time_tag = row.select_one('td:nth-of-type(1)')
-        headline_tag = row.select_one('td:nth-of-type(2) a')
-
-        if time_tag and headline_tag:
-            time_text = time_tag.text.strip()
-            headline = headline_tag.text.strip()
-            link = 'https://finviz.com/' + headline_tag['href']
-
-            if headline in seen_headlines:
-                continue  # Skip already seen headlines
-            seen_headlines.add(headline)
-
-            sentiment = analyzer.polarity_scores(headline)
-            score = sentiment['compound']
-            label = 'Positive' if score >= 0.05 else 'Negative' if score <= -0.05 else 'Neutral'
-
-            news_items.append({
-                'time': time_text,
-                'headline': headline,
-                'link': link,
-                'sentiment': label,
-                'score': round(score, 3)
-            })
+    for record, score in zip(new_records, scores):
+        label = 'Positive' if score >= 0.05 else 'Negative' if score <= -0.05 else 'Neutral'
+
+        news_items.append({
+            'time': record.time,
+            'headline': record.title,
+            'link': record.url,
+            'sentiment': label,
+            'score': round(score, 3)
+        })
 
     return news_items
 
+@st.cache_resource
+def get_ingestor():
+    # Cached across sessions and reruns: one background poll of the shared feed per server process
+    feed = default_feed()
+    ingestor = NewsIngestor(feed.poll, interval=FETCH_INTERVAL)
+
+    @feed.subscribe
+    def ingest(records):
+        try:
+            items = score_news(records)
+            ingestor.add(items)
+        except Exception as e:
+            # The feed only notes consumer errors in feed.errors; the UI shows the ingestor's status
+            ingestor.fail(e)
+            raise
+        # Only stored headlines count as seen, so a failed cycle is scored again on the next poll
+        for item in items:
+            seen_headlines.add(item['headline'])
+
+    return ingestor.start()
+
+def format_item(item, is_new):
+    badge = "🆕 " if is_new else ""
+    return (f"{badge}**[{item['headline']}]({item['link']})**  \n"
+            f"⏱️ {item['time']} | Sentiment: `{item['sentiment']}` | Score: `{item['score']}`")
+
 def main():
     st.set_page_config(page_title="Live News Sentiment Analyzer", layout="wide")
     st.title("📰 Real-Time Finviz News Sentiment Analyzer")
 
-    news_placeholder = st.empty()
-
-    while True:
-        news_items = fetch_news()
-
-        with news_placeholder.container():
-            st.write("### Latest Headlines")
-            for item in news_items:
-                st.markdown(f"**[{item['headline']}]({item['link']})**")
-                st.write(f"⏱️ {item['time']} | Sentiment: `{item['sentiment']}` | Score: `{item['score']}`")
-                st.markdown("---")
-
-        time.sleep(120)  # Refresh every 2 minutes
+    ingestor = get_ingestor()
+    refresh = st.sidebar.slider("Refresh every (seconds)", 5, 300, 30)
+    page_size = st.sidebar.selectbox("Headlines per page", [25, 50, 100], index=1)
+
+    @st.fragment(run_every=refresh)
+    def headlines():
+        # Seqs of the items this session has rendered; anything else gets a badge
+        seen = st.session_state.get('seen_seqs', set())
+        # Count, page total and items all come from one snapshot, so a fetch landing mid-render cannot skew them
+        snap = ingestor.snapshot(st.session_state.get('page', 1) - 1, page_size, seen)
+        page = snap['page'] + 1
+        st.session_state['page'] = page  # clamped if the page count shrank
+        st.number_input("Page", min_value=1, max_value=snap['pages'], step=1, key='page')
+
+        fetched = time.strftime('%H:%M:%S', time.localtime(snap['last_fetch'])) if snap['last_fetch'] else 'pending'
+        st.write(f"### Latest Headlines ({snap['new_count']} new)")
+        st.caption(f"{snap['total']} headlines | last fetch {fetched} | page {page} of {snap['pages']}")
+        if snap['last_error']:
+            st.warning(f"Last fetch failed: {snap['last_error']}")
+
+        # One markdown element per page instead of three per headline
+        items = snap['items']
+        st.markdown("\n\n---\n\n".join(format_item(item, item['seq'] not in seen) for item in items))
+        # Only what was actually shown counts as seen, so unseen items on other pages keep their badge;
+        # seqs the ingestor no longer holds are dropped to keep the set as small as its window
+        st.session_state['seen_seqs'] = {seq for seq in seen if seq >= snap['oldest_seq']} | {item['seq'] for item in items}
+
+    headlines()
 
 if __name__ == "__main__":
     main()
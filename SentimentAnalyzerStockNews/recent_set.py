@@ -0,0 +1,43 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class RecentSet:
+    """In-memory set that forgets keys after `ttl` seconds and never holds more than `max_items`.
+
+    Membership and insertion are O(1); keys are kept in insertion order so
+    expiry and overflow eviction both pop from the oldest end.
+    """
+
+    def __init__(self, ttl=24 * 3600, max_items=50_000):
+        self.ttl = ttl
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self, now):
+        items = self._items
+        while items:
+            ts = next(iter(items.values()))
+            if now - ts < self.ttl and len(items) <= self.max_items:
+                break
+            items.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            self._expire(time.monotonic())
+            return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, key):
+        """Mark `key` as seen. Returns True if it was not already present."""
+        now = time.monotonic()
+        with self._lock:
+            if key in self._items:
+                return False
+            self._items[key] = now
+            self._expire(now)
+        return True
@@ -0,0 +1,12 @@
+import os
+import sys
+
+# The score cache lives with the other scorers in LookUpBasedSentimentAnalyzer so both
+# folders share one cache file. This is the one place that reaches across: the repo root
+# goes on sys.path and the module is imported through its folder name, so that folder's
+# main.py and other modules never shadow ours.
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+from LookUpBasedSentimentAnalyzer.score_cache import ScoreCache, default_score_cache  # noqa: E402
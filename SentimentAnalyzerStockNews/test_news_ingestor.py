@@ -0,0 +1,69 @@
+from news_ingestor import NewsIngestor
+
+
+def headlines(*titles):
+    return [{'headline': title} for title in titles]
+
+
+def make_ingestor(**kwargs):
+    return NewsIngestor(lambda: None, **kwargs)
+
+
+def test_snapshot_pages_newest_first_and_clamps_the_page():
+    ingestor = make_ingestor()
+    ingestor.add(headlines('c', 'b', 'a'))
+    ingestor.add(headlines('e', 'd'))
+
+    snap = ingestor.snapshot(page=0, page_size=2)
+    assert [item['headline'] for item in snap['items']] == ['e', 'd']
+    assert [item['seq'] for item in snap['items']] == [5, 4]
+    assert (snap['pages'], snap['total'], snap['latest_seq'], snap['oldest_seq']) == (3, 5, 5, 1)
+
+    last = ingestor.snapshot(page=7, page_size=2)
+    assert last['page'] == 2
+    assert [item['headline'] for item in last['items']] == ['a']
+
+
+def test_only_rendered_items_count_as_seen():
+    ingestor = make_ingestor()
+    ingestor.add(headlines('d', 'c', 'b', 'a'))
+    seen = set()
+
+    # Render page 0, the newest items; the older page stays unseen
+    first = ingestor.snapshot(page=0, page_size=2, seen=seen)
+    assert first['new_count'] == 4
+    seen |= {item['seq'] for item in first['items']}
+    assert ingestor.snapshot(page=0, page_size=2, seen=seen)['new_count'] == 2
+
+    ingestor.add(headlines('e'))
+    second = ingestor.snapshot(page=1, page_size=2, seen=seen)
+    assert second['new_count'] == 3
+    assert [item['seq'] not in seen for item in second['items']] == [False, True]
+
+
+def test_old_items_fall_out_and_move_oldest_seq():
+    ingestor = make_ingestor(max_items=3)
+    ingestor.add(headlines('e', 'd', 'c', 'b', 'a'))
+
+    snap = ingestor.snapshot(seen={1, 2, 3})
+    assert snap['total'] == 3
+    assert snap['oldest_seq'] == 3
+    assert snap['new_count'] == 2
+    assert make_ingestor().snapshot()['oldest_seq'] == 1
+
+
+def test_refresh_keeps_the_error_until_the_next_successful_add():
+    def poll():
+        raise ConnectionError('feed down')
+
+    ingestor = NewsIngestor(poll)
+    ingestor.refresh()
+    assert ingestor.snapshot()['last_error'] == 'ConnectionError: feed down'
+
+    ingestor.add(headlines('a'))
+    snap = ingestor.snapshot()
+    assert snap['last_error'] is None
+    assert snap['fetches'] == 1
+
+    ingestor.fail(ValueError('bad row'))
+    assert ingestor.snapshot()['last_error'] == 'ValueError: bad row'
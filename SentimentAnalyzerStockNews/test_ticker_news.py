@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("finvizfinance")
+
+from ticker_news import TickerNewsFetcher
+
+
+class StubFetch:
+    """fetch= stand-in: sleeps per ticker and records how many requests overlap.
+
+    Requests for `hung` tickers are left out of the overlap count: they belong
+    to workers that were already replaced.
+    """
+
+    def __init__(self, delays, failures=None, hung=()):
+        self.delays = delays
+        self.failures = dict(failures or {})
+        self.hung = set(hung)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = {}
+
+    def __call__(self, ticker):
+        with self.lock:
+            self.calls[ticker] = self.calls.get(ticker, 0) + 1
+            if ticker not in self.hung:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delays.get(ticker, 0.02))
+            with self.lock:
+                if self.failures.get(ticker, 0) > 0:
+                    self.failures[ticker] -= 1
+                    raise ConnectionError(f"{ticker} unavailable")
+            return pd.DataFrame({"Title": [f"{ticker} news"], "Ticker": [ticker]})
+        finally:
+            with self.lock:
+                if ticker not in self.hung:
+                    self.active -= 1
+
+
+def test_abandoned_worker_does_not_grow_the_pool():
+    # SLOW outlives its timeout and then returns while plenty of the queue is left
+    tickers = ["SLOW"] + [f"T{i}" for i in range(40)]
+    stub = StubFetch({"SLOW": 0.3, **{t: 0.05 for t in tickers[1:]}}, hung={"SLOW"})
+    fetcher = TickerNewsFetcher(max_workers=2, min_interval=0, timeout=0.1, fetch=stub)
+
+    fetched = dict(fetcher.iter_news(tickers))
+
+    assert fetcher.report.timed_out == ["SLOW"]
+    assert sorted(fetched) == sorted(tickers[1:])
+    assert stub.peak <= 2
+
+
+def test_failures_are_retried_then_reported():
+    stub = StubFetch({}, failures={"FLAKY": 1, "DOWN": 5})
+    fetcher = TickerNewsFetcher(max_workers=2, min_interval=0, timeout=5, retries=1, backoff=0, fetch=stub)
+
+    fetched = dict(fetcher.iter_news(["OK", "FLAKY", "DOWN", "OK"]))
+
+    assert sorted(fetched) == ["FLAKY", "OK"]
+    assert list(fetcher.report.failed) == ["DOWN"]
+    assert "ConnectionError" in fetcher.report.failed["DOWN"]
+    assert stub.calls == {"OK": 1, "FLAKY": 2, "DOWN": 2}
@@ -1,25 +1,15 @@
-from urllib.request import urlopen, Request
-from bs4 import BeautifulSoup
+from finviz_feed import default_feed
 
-# FinViz news page URL
-news_url = 'https://finviz.com/news.ashx?v=3'
+# Collect the tickers linked from the news headlines
+def news_tickers(records):
+    return {ticker for record in records for ticker in record.tickers}
 
-# Send the request with a custom user-agent header
-req = Request(url=news_url, headers={'user-agent': 'Mozilla/5.0'})
-response = urlopen(req)
+# Feed consumer: print the tickers found
+def print_tickers(records):
+    print("Tickers found on FinViz news page:")
+    print(sorted(news_tickers(records)))
 
-# Parse the HTML
-html = BeautifulSoup(response, 'html.parser')
-
-# Find all anchor tags (<a>) with href attributes
-tickers = set()
-for link in html.find_all('a', href=True):
-    href = link['href']
-    # Check if the href contains 'quote.ashx?t=' to find the ticker links
-    if 'quote.ashx?t=' in href:
-        ticker = href.split('quote.ashx?t=')[1].split('&')[0].split('#')[0]
-        tickers.add(ticker.upper())
-
-# Print the tickers found
-print("Tickers found on FinViz news page:")
-print(sorted(tickers))
\ No newline at end of file
+if __name__ == "__main__":
+    feed = default_feed()
+    feed.subscribe(print_tickers)
+    feed.poll()
\ No newline at end of file
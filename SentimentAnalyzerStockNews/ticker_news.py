@@ -0,0 +1,172 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+
+from finvizfinance.quote import finvizfinance
+
+
+class RateLimiter:
+    """Starts at most one request every `min_interval` seconds across all threads."""
+
+    def __init__(self, min_interval=0.5):
+        self.min_interval = min_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def fetch_ticker_news(ticker):
+    """News table from the Finviz quote page of one ticker, with a Ticker column."""
+    stock_news = finvizfinance(ticker).ticker_news()
+    if stock_news is not None and len(stock_news) > 0 and 'Ticker' not in stock_news.columns:
+        stock_news['Ticker'] = ticker
+    return stock_news
+
+
+@dataclass
+class FetchReport:
+    tickers: int = 0
+    succeeded: dict = field(default_factory=dict)
+    empty: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+    timed_out: list = field(default_factory=list)
+    seconds: float = 0.0
+
+    def __str__(self):
+        lines = [
+            f"{self.tickers} tickers in {self.seconds:.1f}s: {len(self.succeeded)} with news "
+            f"({sum(self.succeeded.values())} items), {len(self.empty)} empty, "
+            f"{len(self.failed)} failed, {len(self.timed_out)} timed out"
+        ]
+        for ticker, error in self.failed.items():
+            lines.append(f"  {ticker}: {error}")
+        if self.timed_out:
+            lines.append(f"  timed out: {', '.join(self.timed_out)}")
+        return "\n".join(lines)
+
+
+class TickerNewsFetcher:
+    """Fetches per-ticker Finviz news on a bounded thread pool.
+
+    Request starts are spaced `min_interval` seconds apart across all workers
+    so a large universe does not trip Finviz's throttling. A ticker that
+    raises is retried `retries` times with exponential backoff; one that has
+    not finished `timeout` seconds after its first attempt started is given
+    up on. finvizfinance's request has no timeout of its own, so the hung
+    worker is abandoned: workers are daemon threads, which never hold up
+    interpreter exit, and a replacement worker takes over the remaining
+    tickers. An abandoned worker exits once its request returns, so at most
+    `max_workers` threads ever take new tickers. `report` describes the last
+    run.
+    """
+
+    def __init__(self, max_workers=8, min_interval=0.5, timeout=30, retries=1, backoff=2.0, fetch=fetch_ticker_news):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.fetch = fetch
+        self.rate_limiter = RateLimiter(min_interval)
+        self.report = FetchReport()
+
+    def _fetch_one(self, ticker, started):
+        for attempt in range(self.retries + 1):
+            self.rate_limiter.wait()
+            started.setdefault(ticker, time.monotonic())
+            try:
+                return self.fetch(ticker)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def iter_news(self, tickers):
+        """Yield (ticker, news DataFrame) as each ticker completes, in completion order.
+
+        Tickers without news, failures and timeouts are not yielded; they are
+        recorded in `report`.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        report = self.report = FetchReport(tickers=len(tickers))
+        start = time.monotonic()
+        started = {}
+        todo = queue.Queue()
+        for ticker in tickers:
+            todo.put(ticker)
+        results = queue.Queue()
+        stop = threading.Event()
+        lock = threading.Lock()
+        finished = set()   # tickers whose request returned in time; their result is queued
+        abandoned = set()  # tickers given up on; a replacement worker took over
+
+        def worker():
+            while not stop.is_set():
+                try:
+                    ticker = todo.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    result = (ticker, self._fetch_one(ticker, started), None)
+                except Exception as e:
+                    result = (ticker, None, e)
+                with lock:
+                    if ticker in abandoned:
+                        # Our replacement is already running; staying would grow the pool
+                        return
+                    finished.add(ticker)
+                results.put(result)
+
+        def add_worker():
+            # Daemon threads: a hung request must not keep the interpreter alive at exit
+            threading.Thread(target=worker, name="ticker-news", daemon=True).start()
+
+        for _ in range(min(self.max_workers, len(tickers))):
+            add_worker()
+
+        pending = set(tickers)
+        try:
+            while pending:
+                # Wake up by the earliest deadline among running tickers
+                now = time.monotonic()
+                deadlines = [started[t] + self.timeout for t in pending if t in started]
+                wait_for = max(0.0, min(deadlines) - now) if deadlines else self.timeout
+                try:
+                    ticker, stock_news, error = results.get(timeout=min(wait_for, 1.0))
+                except queue.Empty:
+                    pass
+                else:
+                    if ticker in pending:
+                        pending.discard(ticker)
+                        if error is not None:
+                            report.failed[ticker] = f"{type(error).__name__}: {error}"
+                        elif stock_news is None or len(stock_news) == 0:
+                            report.empty.append(ticker)
+                        else:
+                            report.succeeded[ticker] = len(stock_news)
+                            yield ticker, stock_news
+
+                now = time.monotonic()
+                for ticker in [t for t in pending if t in started and now - started[t] > self.timeout]:
+                    with lock:
+                        if ticker in finished:
+                            continue  # returned just now, its result is picked up next round
+                        abandoned.add(ticker)
+                    pending.discard(ticker)
+                    report.timed_out.append(ticker)
+                    # Its worker is stuck in the request; replace it so the rest of the queue keeps moving
+                    if not todo.empty():
+                        add_worker()
+        finally:
+            report.seconds = time.monotonic() - start
+            # Workers stop picking up tickers (e.g. when the caller stopped early)
+            stop.set()